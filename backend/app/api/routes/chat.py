@@ -20,9 +20,10 @@ from app.core.conversation.classifier import (
     ClassificationResult,
     get_evaluation_criteria
 )
-from app.db.database import get_db
+from app.db.database import get_db, get_db_write
 from app.db.models import Query, Response
 from app.config import settings
+from app.core.clients import get_anthropic_client, get_openai_client
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +37,7 @@ EVALUATION_SAMPLE_RATE = 0.1
 async def chat_query(
     request: ChatRequest,
     background_tasks: BackgroundTasks,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_write)
 ):
     """Process a chat query with multi-turn conversation support.
 
@@ -209,8 +210,6 @@ async def _generate_direct_response(
     Used for acknowledgments, closures, greetings, etc.
     """
     import time
-    from anthropic import AsyncAnthropic
-    from openai import AsyncOpenAI
 
     start_time = time.time()
 
@@ -242,7 +241,7 @@ async def _generate_direct_response(
     else:
         # For other types, use LLM but without retrieval
         if request.llm_provider == "anthropic":
-            client = AsyncAnthropic(api_key=settings.anthropic_api_key)
+            client = get_anthropic_client()
             response = await client.messages.create(
                 model=settings.claude_model,
                 max_tokens=500,
@@ -252,7 +251,7 @@ async def _generate_direct_response(
             )
             response_text = response.content[0].text
         else:
-            client = AsyncOpenAI(api_key=settings.openai_api_key)
+            client = get_openai_client()
             response = await client.chat.completions.create(
                 model=settings.openai_model,
                 messages=[
@@ -388,7 +387,7 @@ async def _evaluate_response_async(
                 evaluation_type=f"ragas_{message_type.value}",
                 scores_json=evaluation_result.get("scores", {}),
                 evaluator=evaluation_result.get("evaluator", "ragas/anthropic"),
-                metadata={
+                eval_metadata={
                     "message_type": message_type.value,
                     "async_evaluation": True,
                     "sample_rate": EVALUATION_SAMPLE_RATE,
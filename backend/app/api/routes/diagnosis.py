@@ -5,11 +5,11 @@ Endpoints for analyzing evaluations and getting improvement suggestions.
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.database import get_db
-from app.evaluation.diagnosis.agent import DiagnosisAgent, report_to_dict
+from app.evaluation.diagnosis.agent import DiagnosisAgent, report_to_json
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -31,7 +31,7 @@ async def get_diagnosis_report(
     """
     agent = DiagnosisAgent(db)
     report = await agent.generate_report(days=days)
-    return report_to_dict(report)
+    return Response(content=report_to_json(report), media_type="application/json")
 
 
 @router.get("/summary")
@@ -12,7 +12,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc, func
 
-from app.db.database import get_db
+from app.db.database import get_db, get_db_write
 from app.db.models import Evaluation, Query as QueryModel, Response as ResponseModel
 from app.api.schemas.evaluation import (
     EvaluationRequest,
@@ -29,7 +29,7 @@ from app.api.schemas.evaluation import (
     QuestionCoverageDetail,
     ContextUtilizationDetail,
 )
-import json
+import orjson
 from app.evaluation.ragas import RAGASEvaluator
 from app.core.generation.claude import ClaudeGenerator
 from app.core.generation.openai_gen import OpenAIGenerator
@@ -53,7 +53,7 @@ router = APIRouter()
 @router.post("/run", response_model=EvaluationResponse)
 async def run_evaluation(
     request: EvaluationRequest,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_write)
 ):
     """Run RAGAS evaluation on a specific query response.
 
@@ -110,14 +110,13 @@ async def run_evaluation(
             evaluation_type="ragas",
             scores_json=evaluation_result.get("scores", {}),
             evaluator=evaluation_result.get("evaluator", "ragas/unknown"),
-            metadata={
+            eval_metadata={
                 "expected_category": request.expected_category,
                 "expected_intent": request.expected_intent,
                 "has_ground_truth": evaluation_result.get("has_ground_truth", False),
                 "has_conversation_context": has_context,
                 "metrics_used": evaluation_result.get("metrics_used", [])
-            },
-            timestamp=datetime.utcnow()
+            }
         )
 
         db.add(evaluation)
@@ -143,7 +142,7 @@ async def run_evaluation(
 @router.post("/batch", response_model=BatchEvaluationResponse)
 async def run_batch_evaluation(
     request: BatchEvaluationRequest,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_write)
 ):
     """Run RAGAS evaluation on multiple queries in batch.
 
@@ -155,62 +154,67 @@ async def run_batch_evaluation(
 
         evaluator = RAGASEvaluator(provider=request.evaluator_provider or "anthropic")
 
+        # Fetch all queries and responses in one round trip
+        stmt = (
+            select(QueryModel, ResponseModel)
+            .join(ResponseModel, QueryModel.id == ResponseModel.query_id)
+            .where(QueryModel.id.in_(request.query_ids))
+        )
+        rows = {}
+        for query_obj, response_obj in await db.execute(stmt):
+            rows.setdefault(query_obj.id, (query_obj, response_obj))
+
+        found_ids = []
         for query_id in request.query_ids:
-            try:
-                # Fetch query and response
-                stmt = (
-                    select(QueryModel, ResponseModel)
-                    .join(ResponseModel, QueryModel.id == ResponseModel.query_id)
-                    .where(QueryModel.id == query_id)
-                )
-                result = await db.execute(stmt)
-                row = result.first()
-
-                if not row:
-                    errors.append({
-                        "query_id": str(query_id),
-                        "error": "Query not found"
-                    })
-                    continue
-
-                query_obj, response_obj = row
-                contexts = response_obj.sources_json or []
-
-                # Evaluate with RAGAS
-                evaluation_result = await evaluator.evaluate_response(
-                    query=query_obj.query_text,
-                    response=response_obj.response_text,
-                    contexts=contexts,
-                    expected_answer=None
-                )
-
-                # Store evaluation
-                evaluation = Evaluation(
-                    id=uuid4(),
-                    query_id=query_id,
-                    evaluation_type="ragas_batch",
-                    scores_json=evaluation_result.get("scores", {}),
-                    evaluator=evaluation_result.get("evaluator", "ragas/unknown"),
-                    metadata={
-                        "batch_id": request.batch_name,
-                        "has_ground_truth": evaluation_result.get("has_ground_truth", False)
-                    },
-                    timestamp=datetime.utcnow()
-                )
-
-                db.add(evaluation)
-                results.append({
+            if query_id in rows:
+                found_ids.append(query_id)
+            else:
+                errors.append({
                     "query_id": str(query_id),
-                    "overall_score": evaluation_result.get("overall_score"),
-                    "status": "success"
+                    "error": "Query not found"
                 })
 
-            except Exception as e:
-                logger.error(f"Failed to evaluate query {query_id}: {e}")
+        # Evaluate with RAGAS in a single batch so judge calls run
+        # concurrently instead of one query at a time
+        evaluation_results = await evaluator.evaluate_batch([
+            {
+                "query": rows[query_id][0].query_text,
+                "response": rows[query_id][1].response_text,
+                "contexts": rows[query_id][1].sources_json or [],
+                "expected_answer": None
+            }
+            for query_id in found_ids
+        ])
+
+        for query_id, evaluation_result in zip(found_ids, evaluation_results):
+            if evaluation_result.get("error"):
+                logger.error(f"Failed to evaluate query {query_id}: {evaluation_result['error']}")
                 errors.append({
                     "query_id": str(query_id),
-                    "error": str(e)
+                    "error": evaluation_result["error"]
                 })
+                continue
+
+            # Store evaluation
+            evaluation = Evaluation(
+                id=uuid4(),
+                query_id=query_id,
+                evaluation_type="ragas_batch",
+                scores_json=evaluation_result.get("scores", {}),
+                evaluator=evaluation_result.get("evaluator", "ragas/unknown"),
+                eval_metadata={
+                    "batch_id": request.batch_name,
+                    "has_ground_truth": evaluation_result.get("has_ground_truth", False)
+                },
+                timestamp=datetime.utcnow()
+            )
+
+            db.add(evaluation)
+            results.append({
+                "query_id": str(query_id),
+                "overall_score": evaluation_result.get("overall_score"),
+                "status": "success"
+            })
 
         await db.commit()
 
@@ -366,7 +370,7 @@ async def compare_claims(request: ClaimCompareRequest):
             temperature=0.0,
         )
 
-        parsed = json.loads(result["text"])
+        parsed = orjson.loads(result["text"])
         claims = [
             Claim(
                 claim=c["claim"],
@@ -379,7 +383,7 @@ async def compare_claims(request: ClaimCompareRequest):
 
         return ClaimCompareResponse(claims=claims)
 
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error(f"Failed to parse claim comparison response: {e}")
         raise HTTPException(status_code=500, detail="LLM returned invalid JSON")
     except Exception as e:
@@ -459,7 +463,7 @@ async def get_detailed_analysis(request: DetailedAnalysisRequest):
             max_tokens=4096,
         )
 
-        parsed = json.loads(result["text"])
+        parsed = orjson.loads(result["text"])
 
         # Build response, handling each section gracefully
         faithfulness = None
@@ -489,7 +493,7 @@ async def get_detailed_analysis(request: DetailedAnalysisRequest):
             context_precision=context_precision,
         )
 
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error(f"Failed to parse detailed analysis response: {e}")
         raise HTTPException(
             status_code=500,
@@ -12,7 +12,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, desc
 
-from app.db.database import get_db
+from app.db.database import get_db, get_db_write
 from app.db.models import GoldenTestSet, GoldenTestCase, EvaluationRun
 from app.api.schemas.golden_set import (
     GoldenSetCreate,
@@ -42,7 +42,7 @@ router = APIRouter()
 @router.post("/", response_model=GoldenSetResponse)
 async def create_golden_set(
     request: GoldenSetCreate,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_write)
 ):
     """Create a new golden test set."""
     # Check if name already exists
@@ -56,8 +56,7 @@ async def create_golden_set(
         id=uuid4(),
         name=request.name,
         description=request.description,
-        version=1,
-        created_at=datetime.utcnow()
+        version=1
     )
 
     db.add(golden_set)
@@ -167,7 +166,7 @@ async def get_golden_set(
 async def update_golden_set(
     golden_set_id: UUID,
     request: GoldenSetUpdate,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_write)
 ):
     """Update a golden set's name or description."""
     gs = await db.get(GoldenTestSet, golden_set_id)
@@ -205,7 +204,7 @@ async def update_golden_set(
 @router.delete("/{golden_set_id}")
 async def delete_golden_set(
     golden_set_id: UUID,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_write)
 ):
     """Delete a golden set and all its test cases."""
     gs = await db.get(GoldenTestSet, golden_set_id)
@@ -224,7 +223,7 @@ async def delete_golden_set(
 async def add_test_case(
     golden_set_id: UUID,
     request: TestCaseCreate,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_write)
 ):
     """Add a test case to a golden set."""
     # Verify golden set exists
@@ -239,8 +238,7 @@ async def add_test_case(
         expected_answer=request.expected_answer,
         category=request.category,
         intent=request.intent,
-        case_metadata=request.metadata,
-        created_at=datetime.utcnow()
+        case_metadata=request.metadata
     )
 
     db.add(test_case)
@@ -268,7 +266,7 @@ async def add_test_case(
 async def add_test_cases_bulk(
     golden_set_id: UUID,
     cases: List[TestCaseCreate],
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_write)
 ):
     """Add multiple test cases to a golden set."""
     gs = await db.get(GoldenTestSet, golden_set_id)
@@ -284,7 +282,7 @@ async def add_test_cases_bulk(
             expected_answer=case.expected_answer,
             category=case.category,
             intent=case.intent,
-            metadata=case.case_metadata,
+            case_metadata=case.metadata,
             created_at=datetime.utcnow()
         )
         db.add(test_case)
@@ -326,7 +324,7 @@ async def update_test_case(
     golden_set_id: UUID,
     case_id: UUID,
     request: TestCaseUpdate,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_write)
 ):
     """Update a test case."""
     tc = await db.get(GoldenTestCase, case_id)
@@ -369,7 +367,7 @@ async def update_test_case(
 async def delete_test_case(
     golden_set_id: UUID,
     case_id: UUID,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_write)
 ):
     """Delete a test case."""
     tc = await db.get(GoldenTestCase, case_id)
@@ -397,7 +395,7 @@ async def import_from_holdout(
     max_cases: Optional[int] = Query(None, description="Max cases to import"),
     categories: Optional[List[str]] = Query(None, description="Filter by categories"),
     intents: Optional[List[str]] = Query(None, description="Filter by intents"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_write)
 ):
     """Import test cases from the stratified holdout set.
 
@@ -424,11 +422,11 @@ async def import_from_holdout(
 
     for item in holdout_items:
         # Apply filters
-        if categories and item.get("category", "").upper() not in [c.upper() for c in categories]:
+        if categories and item.category.upper() not in [c.upper() for c in categories]:
             skipped += 1
             continue
 
-        if intents and item.get("intent", "").lower() not in [i.lower() for i in intents]:
+        if intents and item.intent.lower() not in [i.lower() for i in intents]:
             skipped += 1
             continue
 
@@ -440,14 +438,14 @@ async def import_from_holdout(
             test_case = GoldenTestCase(
                 id=uuid4(),
                 test_set_id=golden_set_id,
-                query=item["instruction"],
-                expected_answer=item["response"],
-                category=item.get("category"),
-                intent=item.get("intent"),
+                query=item.instruction,
+                expected_answer=item.response,
+                category=item.category,
+                intent=item.intent,
                 case_metadata={
-                    "flags": item.get("flags"),
-                    "original_index": item.get("original_index"),
-                    "source_id": item.get("source_id")
+                    "flags": item.flags,
+                    "original_index": item.original_index,
+                    "source_id": item.source_id
                 },
                 created_at=datetime.utcnow()
             )
@@ -478,7 +476,7 @@ async def run_golden_set_evaluation(
     golden_set_id: UUID,
     request: RunTestSetRequest,
     background_tasks: BackgroundTasks,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_write)
 ):
     """Run evaluation on all test cases in a golden set.
 
@@ -509,8 +507,7 @@ async def run_golden_set_evaluation(
             "top_k": request.top_k,
             "run_name": request.run_name
         },
-        status="pending",
-        started_at=datetime.utcnow()
+        status="pending"
     )
 
     db.add(run)
@@ -586,27 +583,32 @@ async def _run_evaluation_task(
             results = []    # Final per-case results (including errors)
             failed = 0
 
-            for tc in test_cases:
-                try:
-                    rag_result = await retriever.query(
-                        query_text=tc.query,
-                        top_k=config.top_k,
-                        llm_provider=config.llm_provider
-                    )
-                    generated.append({
-                        "test_case": tc,
-                        "rag_result": rag_result,
-                    })
-                except Exception as e:
-                    logger.error(f"RAG pipeline failed for test case {tc.id}: {e}")
+            # One batched retrieval for all test cases, concurrent generation
+            try:
+                rag_results = await retriever.query_batch(
+                    query_texts=[tc.query for tc in test_cases],
+                    top_k=config.top_k,
+                    llm_provider=config.llm_provider
+                )
+            except Exception as e:
+                rag_results = [e] * len(test_cases)
+
+            for tc, rag_result in zip(test_cases, rag_results):
+                if isinstance(rag_result, Exception):
+                    logger.error(f"RAG pipeline failed for test case {tc.id}: {rag_result}")
                     failed += 1
                     results.append({
                         "test_case_id": str(tc.id),
                         "query": tc.query,
                         "status": "error",
-                        "error": str(e),
+                        "error": str(rag_result),
                         "sources": [],
                     })
+                else:
+                    generated.append({
+                        "test_case": tc,
+                        "rag_result": rag_result,
+                    })
 
             # === Pass 2: Batched RAGAS evaluation ===
             if generated:
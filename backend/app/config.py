@@ -1,6 +1,6 @@
 """Application configuration management."""
 import os
-from typing import List
+from typing import List, Optional
 from pydantic_settings import BaseSettings
 
 
@@ -13,9 +13,18 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30  # Seconds to wait for a pooled connection
+    db_pool_recycle: int = 1800  # Seconds before a connection is replaced
+    auto_create_tables: bool = True  # Create tables on startup; disable when schema is managed externally
 
     # ChromaDB
     chromadb_path: str = "/app/data/chromadb"
+    hnsw_m: int = 32  # Graph degree (Chroma default 16)
+    hnsw_construction_ef: int = 200  # Build-time candidate list (default 100)
+    hnsw_search_ef: int = 128  # Query-time candidate list (default 10)
+    chroma_max_workers: int = 4  # Threads for blocking ChromaDB calls
 
     # Application
     log_level: str = "INFO"
@@ -33,9 +42,19 @@ class Settings(BaseSettings):
     embedding_model: str = "text-embedding-3-small"
     embedding_dimensions: int = 1536
     top_k: int = 5
+    mmr_lambda: Optional[float] = None  # Set (e.g. 0.7) to rerank results with MMR
+    mmr_fetch_factor: int = 3  # Candidates fetched per result when MMR is on
+    query_embedding_cache_size: int = 1024  # Query embeddings kept in memory
     chunk_size: int = 500
     chunk_overlap: int = 50
 
+    # Evaluation
+    evaluation_cache_size: int = 512  # RAGAS results reused for identical samples
+    ragas_max_workers: int = 4  # Concurrent RAGAS evaluation runs
+
+    # Diagnosis
+    diagnosis_summary_ttl: int = 60  # Seconds a quick summary is reused
+
     # Data paths
     raw_data_path: str = "/app/data/raw"
     processed_data_path: str = "/app/data/processed"
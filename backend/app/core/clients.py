@@ -0,0 +1,53 @@
+"""Shared Anthropic and OpenAI API clients.
+
+Each SDK client owns an HTTP connection pool. Generators, the classifier
+and the diagnosis agent are created per request, so they share one client
+per API key instead of opening new connections every time.
+"""
+from typing import Any, Dict, Tuple
+
+from anthropic import AsyncAnthropic
+from openai import AsyncOpenAI
+
+from app.config import settings
+
+_clients: Dict[Tuple[str, str], Any] = {}
+
+
+def get_anthropic_client(api_key: str = None) -> AsyncAnthropic:
+    """Return the shared Anthropic client.
+
+    Args:
+        api_key: Anthropic API key (defaults to settings)
+
+    Returns:
+        AsyncAnthropic client for the key
+    """
+    api_key = api_key or settings.anthropic_api_key
+    key = ("anthropic", api_key)
+    if key not in _clients:
+        _clients[key] = AsyncAnthropic(api_key=api_key)
+    return _clients[key]
+
+
+def get_openai_client(api_key: str = None) -> AsyncOpenAI:
+    """Return the shared OpenAI client.
+
+    Args:
+        api_key: OpenAI API key (defaults to settings)
+
+    Returns:
+        AsyncOpenAI client for the key
+    """
+    api_key = api_key or settings.openai_api_key
+    key = ("openai", api_key)
+    if key not in _clients:
+        _clients[key] = AsyncOpenAI(api_key=api_key)
+    return _clients[key]
+
+
+async def close_clients() -> None:
+    """Close all shared clients and their connection pools."""
+    for client in _clients.values():
+        await client.close()
+    _clients.clear()
@@ -5,15 +5,13 @@ Classifies user messages to determine:
 2. Whether RAG retrieval is needed
 """
 import logging
-import json
+import orjson
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from enum import Enum
 
-from anthropic import AsyncAnthropic
-from openai import AsyncOpenAI
-
-from app.config import settings
+from app.core.clients import get_anthropic_client, get_openai_client
+from app.core.generation.output_parsing import strip_code_fence
 
 logger = logging.getLogger(__name__)
 
@@ -84,11 +82,11 @@ class MessageClassifier:
         self.provider = provider.lower()
 
         if self.provider == "anthropic":
-            self.client = AsyncAnthropic(api_key=settings.anthropic_api_key)
+            self.client = get_anthropic_client()
             # Use Haiku for fast, cheap classification
             self.model = model or "claude-3-haiku-20240307"
         elif self.provider == "openai":
-            self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+            self.client = get_openai_client()
             self.model = model or "gpt-3.5-turbo"
         else:
             raise ValueError(f"Unsupported provider: {provider}")
@@ -258,15 +256,7 @@ class MessageClassifier:
         """Parse LLM response into ClassificationResult."""
         try:
             # Clean up response (remove markdown code blocks if present)
-            text = response_text.strip()
-            if text.startswith("```json"):
-                text = text[7:]
-            elif text.startswith("```"):
-                text = text[3:]
-            if text.endswith("```"):
-                text = text[:-3]
-
-            data = json.loads(text.strip())
+            data = orjson.loads(strip_code_fence(response_text))
 
             message_type = MessageType(data.get("message_type", "question"))
             needs_retrieval = data.get("needs_retrieval", True)
@@ -280,7 +270,7 @@ class MessageClassifier:
                 reasoning=reasoning
             )
 
-        except (json.JSONDecodeError, ValueError) as e:
+        except (orjson.JSONDecodeError, ValueError) as e:
             logger.error(f"Failed to parse classification response: {e}")
             return ClassificationResult(
                 message_type=MessageType.QUESTION,
@@ -1,12 +1,19 @@
 """OpenAI embeddings wrapper."""
 import logging
-from typing import List
-from openai import AsyncOpenAI
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+import numpy as np
 
 from app.config import settings
+from app.core.clients import get_openai_client
 
 logger = logging.getLogger(__name__)
 
+# LRU of query embeddings keyed on (model, dimensions, text). Module level
+# because a new retriever (and embeddings client) is built per request.
+_query_cache: "OrderedDict[Tuple[str, int, str], np.ndarray]" = OrderedDict()
+
 
 class OpenAIEmbeddings:
     """Wrapper for OpenAI embeddings API."""
@@ -20,17 +27,17 @@ class OpenAIEmbeddings:
         """
         self.api_key = api_key or settings.openai_api_key
         self.model = model or settings.embedding_model
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        self.client = get_openai_client(self.api_key)
         self.dimensions = settings.embedding_dimensions
 
-    async def embed_text(self, text: str) -> List[float]:
+    async def embed_text(self, text: str) -> np.ndarray:
         """Generate embedding for a single text.
 
         Args:
             text: Input text
 
         Returns:
-            Embedding vector
+            Embedding vector (float32)
         """
         response = await self.client.embeddings.create(
             model=self.model,
@@ -38,19 +45,22 @@ class OpenAIEmbeddings:
             dimensions=self.dimensions
         )
 
-        return response.data[0].embedding
+        return np.asarray(response.data[0].embedding, dtype=np.float32)
 
-    async def embed_batch(self, texts: List[str], batch_size: int = 100) -> List[List[float]]:
+    async def embed_batch(self, texts: List[str], batch_size: int = 100) -> np.ndarray:
         """Generate embeddings for multiple texts.
 
+        Vectors are packed into one float32 array as each response arrives,
+        so only one batch of boxed Python floats exists at a time.
+
         Args:
             texts: List of input texts
             batch_size: Process in batches to avoid rate limits
 
         Returns:
-            List of embedding vectors
+            Array of shape (len(texts), dimensions), float32
         """
-        all_embeddings = []
+        all_embeddings = np.empty((len(texts), self.dimensions), dtype=np.float32)
 
         for i in range(0, len(texts), batch_size):
             batch = texts[i:i + batch_size]
@@ -63,8 +73,42 @@ class OpenAIEmbeddings:
                 dimensions=self.dimensions
             )
 
-            batch_embeddings = [item.embedding for item in response.data]
-            all_embeddings.extend(batch_embeddings)
+            all_embeddings[i:i + len(batch)] = [item.embedding for item in response.data]
 
         logger.info(f"Generated {len(all_embeddings)} embeddings")
         return all_embeddings
+
+    async def embed_queries(self, texts: List[str]) -> List[np.ndarray]:
+        """Embed query strings, reusing cached embeddings for repeated queries.
+
+        Args:
+            texts: Query strings
+
+        Returns:
+            List of float32 embedding vectors, in input order
+        """
+        keys = [(self.model, self.dimensions, text) for text in texts]
+        found: Dict[Tuple[str, int, str], np.ndarray] = {}
+
+        for key in keys:
+            embedding = _query_cache.get(key)
+            if embedding is not None:
+                _query_cache.move_to_end(key)
+                found[key] = embedding
+
+        missing = list(dict.fromkeys(text for key, text in zip(keys, texts) if key not in found))
+        if missing:
+            if len(missing) == 1:
+                embeddings = [await self.embed_text(missing[0])]
+            else:
+                embeddings = await self.embed_batch(missing)
+
+            for text, embedding in zip(missing, embeddings):
+                key = (self.model, self.dimensions, text)
+                found[key] = embedding
+                _query_cache[key] = embedding
+
+            while len(_query_cache) > settings.query_embedding_cache_size:
+                _query_cache.popitem(last=False)
+
+        return [found[key] for key in keys]
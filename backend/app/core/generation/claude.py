@@ -2,9 +2,9 @@
 import logging
 import time
 from typing import List, Dict, Any
-from anthropic import AsyncAnthropic
 
 from app.config import settings
+from app.core.clients import get_anthropic_client
 from app.core.generation.prompt_templates import CUSTOMER_SUPPORT_SYSTEM_PROMPT
 
 logger = logging.getLogger(__name__)
@@ -22,7 +22,7 @@ class ClaudeGenerator:
         """
         self.api_key = api_key or settings.anthropic_api_key
         self.model = model or settings.claude_model
-        self.client = AsyncAnthropic(api_key=self.api_key)
+        self.client = get_anthropic_client(self.api_key)
 
     async def generate(
         self,
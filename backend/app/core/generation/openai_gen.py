@@ -2,9 +2,9 @@
 import logging
 import time
 from typing import Dict, Any
-from openai import AsyncOpenAI
 
 from app.config import settings
+from app.core.clients import get_openai_client
 from app.core.generation.prompt_templates import CUSTOMER_SUPPORT_SYSTEM_PROMPT
 
 logger = logging.getLogger(__name__)
@@ -22,7 +22,7 @@ class OpenAIGenerator:
         """
         self.api_key = api_key or settings.openai_api_key
         self.model = model or settings.openai_model
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        self.client = get_openai_client(self.api_key)
 
     async def generate(
         self,
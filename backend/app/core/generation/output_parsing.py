@@ -0,0 +1,19 @@
+"""Helpers for parsing structured LLM output."""
+
+
+def strip_code_fence(text: str) -> str:
+    """Remove a markdown code fence wrapped around an LLM response.
+
+    Args:
+        text: Raw response text, optionally wrapped in ```json ... ```
+
+    Returns:
+        The response body with surrounding whitespace removed
+    """
+    return (
+        text.strip()
+        .removeprefix("```json")
+        .removeprefix("```")
+        .removesuffix("```")
+        .strip()
+    )
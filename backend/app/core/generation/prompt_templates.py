@@ -1,4 +1,5 @@
 """Enhanced prompt templates for RAG generation with metadata awareness."""
+from functools import lru_cache
 
 CUSTOMER_SUPPORT_SYSTEM_PROMPT = """You are a helpful customer support assistant. Your role is to provide accurate, friendly, and concise answers to customer questions.
 
@@ -67,16 +68,38 @@ def create_rag_prompt(query: str, contexts: list[dict]) -> str:
     Returns:
         Formatted prompt string with metadata
     """
-    # Format contexts with rich metadata
-    context_blocks = []
+    # Key the cache on exactly the fields the prompt renders, so any change
+    # to a context's text or metadata produces a fresh prompt
+    context_fields = []
 
-    for i, ctx in enumerate(contexts):
+    for ctx in contexts:
         metadata = ctx.get('metadata', {})
-        category = metadata.get('category', 'N/A')
-        intent = metadata.get('intent', 'N/A')
-        flags = metadata.get('flags', '')
-        relevance = ctx.get('score', 0.0)
+        context_fields.append((
+            metadata.get('category', 'N/A'),
+            metadata.get('intent', 'N/A'),
+            metadata.get('flags', ''),
+            ctx.get('score', 0.0),
+            ctx['text'],
+        ))
+
+    return _build_rag_prompt(query, tuple(context_fields))
+
+
+@lru_cache(maxsize=1024)
+def _build_rag_prompt(query: str, context_fields: tuple) -> str:
+    """Render the RAG prompt; memoized for repeated evaluation passes.
 
+    Args:
+        query: User's question
+        context_fields: (category, intent, flags, score, text) per context
+
+    Returns:
+        Formatted prompt string with metadata
+    """
+    # Format contexts with rich metadata
+    context_blocks = []
+
+    for i, (category, intent, flags, relevance, text) in enumerate(context_fields):
         # Parse flags for context
         flag_desc = parse_flags_for_prompt(flags)
 
@@ -86,7 +109,7 @@ Intent: {intent}
 {flag_desc}
 Relevance Score: {relevance:.2f}
 
-{ctx['text']}"""
+{text}"""
 
         context_blocks.append(context_block)
 
@@ -116,53 +139,23 @@ Your task is to evaluate responses across multiple dimensions considering:
 Be objective and thorough in your evaluation."""
 
 
-def create_evaluation_prompt(
-    query: str,
-    response: str,
-    contexts: list[dict],
-    expected_category: str = None,
-    expected_intent: str = None
-) -> str:
-    """Create prompt for LLM-as-judge evaluation.
-
-    Args:
-        query: Original customer query
-        response: Chatbot's response
-        contexts: Retrieved contexts used
-        expected_category: Expected category (if known from golden set)
-        expected_intent: Expected intent (if known from golden set)
-
-    Returns:
-        Evaluation prompt
-    """
-    # Format contexts
-    context_str = "\n\n".join([
-        f"[Context {i+1}] (Category: {ctx['metadata'].get('category')}, "
-        f"Intent: {ctx['metadata'].get('intent')}, "
-        f"Flags: {ctx['metadata'].get('flags', 'None')}, "
-        f"Relevance: {ctx['score']:.2f})\n{ctx['text']}"
-        for i, ctx in enumerate(contexts)
-    ])
+_EVAL_HEADER = """Evaluate the following customer support interaction:
 
-    expected_info = ""
-    if expected_category or expected_intent:
-        expected_info = f"""
-Expected Classification:
-- Category: {expected_category or 'Not specified'}
-- Intent: {expected_intent or 'Not specified'}
+CUSTOMER QUERY:
 """
 
-    prompt = f"""Evaluate the following customer support interaction:
-
-CUSTOMER QUERY:
-{query}
+_EVAL_QUERY_CTX_SEP = """
 
 RETRIEVED CONTEXT PROVIDED TO CHATBOT:
-{context_str}
+"""
+
+_EVAL_CTX_RESP_SEP = """
 
 CHATBOT'S RESPONSE:
-{response}
-{expected_info}
+"""
+
+# Constant rubric + JSON schema appended to every evaluation prompt
+_EVAL_RUBRIC_SUFFIX = """
 
 Please evaluate the response on the following criteria (score each 0-5):
 
@@ -197,53 +190,70 @@ Please evaluate the response on the following criteria (score each 0-5):
    - 0: Confusing or poorly structured
 
 Provide your evaluation in the following JSON format:
-{{
-    "scores": {{
+{
+    "scores": {
         "accuracy": <0-5>,
         "completeness": <0-5>,
         "faithfulness": <0-5>,
         "tone": <0-5>,
         "relevance": <0-5>,
         "clarity": <0-5>
-    }},
+    },
     "overall_score": <average of above scores>,
     "explanation": "<brief explanation of your scoring>",
     "strengths": ["<strength 1>", "<strength 2>"],
     "weaknesses": ["<weakness 1>", "<weakness 2>"],
     "suggested_improvement": "<optional suggestion for improvement>"
-}}"""
-
-    return prompt
+}"""
 
 
-# Template for evaluation with expected answer (golden set)
-def create_golden_set_evaluation_prompt(
+def create_evaluation_prompt(
     query: str,
     response: str,
-    expected_answer: str,
     contexts: list[dict],
-    category: str,
-    intent: str
+    expected_category: str = None,
+    expected_intent: str = None
 ) -> str:
-    """Create evaluation prompt when we have expected answer from golden set.
+    """Create prompt for LLM-as-judge evaluation.
 
     Args:
-        query: Customer query
-        response: Chatbot response
-        expected_answer: Expected/ideal answer
-        contexts: Retrieved contexts
-        category: Expected category
-        intent: Expected intent
+        query: Original customer query
+        response: Chatbot's response
+        contexts: Retrieved contexts used
+        expected_category: Expected category (if known from golden set)
+        expected_intent: Expected intent (if known from golden set)
 
     Returns:
-        Evaluation prompt with expected answer comparison
+        Evaluation prompt
     """
+    # Format contexts
     context_str = "\n\n".join([
-        f"[Context {i+1}] (Relevance: {ctx['score']:.2f})\n{ctx['text']}"
+        f"[Context {i+1}] (Category: {ctx['metadata'].get('category')}, "
+        f"Intent: {ctx['metadata'].get('intent')}, "
+        f"Flags: {ctx['metadata'].get('flags', 'None')}, "
+        f"Relevance: {ctx['score']:.2f})\n{ctx['text']}"
         for i, ctx in enumerate(contexts)
     ])
 
-    prompt = f"""Evaluate this customer support interaction against the expected answer:
+    expected_info = ""
+    if expected_category or expected_intent:
+        expected_info = f"""
+Expected Classification:
+- Category: {expected_category or 'Not specified'}
+- Intent: {expected_intent or 'Not specified'}
+"""
+
+    # Only the variable parts are formatted; the rubric is a precomputed constant
+    return (
+        _EVAL_HEADER + query
+        + _EVAL_QUERY_CTX_SEP + context_str
+        + _EVAL_CTX_RESP_SEP + response
+        + "\n" + expected_info
+        + _EVAL_RUBRIC_SUFFIX
+    )
+
+
+_GOLDEN_EVAL_TEMPLATE = """Evaluate this customer support interaction against the expected answer:
 
 CUSTOMER QUERY:
 {query}
@@ -259,7 +269,10 @@ EXPECTED/IDEAL ANSWER:
 
 ACTUAL CHATBOT RESPONSE:
 {response}
+"""
 
+# Constant rubric + JSON schema appended to every golden set evaluation prompt
+_GOLDEN_EVAL_RUBRIC_SUFFIX = """
 Evaluate how well the actual response matches the expected answer on these criteria (0-5 scale):
 
 1. **Semantic Similarity**: Does it convey the same meaning as the expected answer?
@@ -269,21 +282,56 @@ Evaluate how well the actual response matches the expected answer on these crite
 5. **Conciseness**: Is it appropriately concise (not too verbose or too brief)?
 
 Provide evaluation in JSON format:
-{{
-    "scores": {{
+{
+    "scores": {
         "semantic_similarity": <0-5>,
         "information_coverage": <0-5>,
         "accuracy": <0-5>,
         "tone_match": <0-5>,
         "conciseness": <0-5>
-    }},
+    },
     "overall_score": <average>,
     "passes_threshold": <true if overall >= 4.0>,
     "explanation": "<explanation>",
     "key_differences": ["<difference 1>", "<difference 2>"]
-}}"""
+}"""
 
-    return prompt
+
+# Template for evaluation with expected answer (golden set)
+def create_golden_set_evaluation_prompt(
+    query: str,
+    response: str,
+    expected_answer: str,
+    contexts: list[dict],
+    category: str,
+    intent: str
+) -> str:
+    """Create evaluation prompt when we have expected answer from golden set.
+
+    Args:
+        query: Customer query
+        response: Chatbot response
+        expected_answer: Expected/ideal answer
+        contexts: Retrieved contexts
+        category: Expected category
+        intent: Expected intent
+
+    Returns:
+        Evaluation prompt with expected answer comparison
+    """
+    context_str = "\n\n".join([
+        f"[Context {i+1}] (Relevance: {ctx['score']:.2f})\n{ctx['text']}"
+        for i, ctx in enumerate(contexts)
+    ])
+
+    return _GOLDEN_EVAL_TEMPLATE.format(
+        query=query,
+        category=category,
+        intent=intent,
+        context_str=context_str,
+        expected_answer=expected_answer,
+        response=response,
+    ) + _GOLDEN_EVAL_RUBRIC_SUFFIX
 
 
 # --- Claim Comparison Prompt (used by /evaluation/compare-claims) ---
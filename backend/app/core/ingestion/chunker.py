@@ -1,10 +1,33 @@
 """Document chunking logic for Bitext Q&A pairs."""
 import tiktoken
-from typing import List, Dict, Any
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional
 import logging
 
+from app.core.ingestion.loader import QAItem
+
 logger = logging.getLogger(__name__)
 
+# Q&A texts tokenized per encode_batch call; bounds the token lists held at once
+TOKENIZE_BATCH_SIZE = 2000
+
+
+@dataclass(slots=True)
+class ChunkMeta:
+    """Metadata attached to a single chunk.
+
+    Slotted to avoid a per-chunk __dict__. The vector store converts it to
+    a plain dict when writing to ChromaDB.
+    """
+    category: str
+    intent: str
+    flags: str
+    question: str
+    token_count: int
+    chunk_index: int
+    total_chunks: int
+    source_doc_id: int = -1
+
 
 class BitetChunker:
     """Chunker for Bitext customer support Q&A pairs.
@@ -31,40 +54,42 @@ class BitetChunker:
         """Count tokens in text using tiktoken."""
         return len(self.encoding.encode(text))
 
-    def chunk_qa_pair(self, qa_item: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def chunk_qa_pair(self, qa_item: QAItem, token_count: Optional[int] = None) -> List[Dict[str, Any]]:
         """Chunk a single Q&A pair from Bitext dataset.
 
         Args:
-            qa_item: Dictionary with keys: instruction, response, category, intent, flags
+            qa_item: Q&A item with instruction, response, category, intent, flags
+            token_count: Precomputed token count of the Q&A text, if known
 
         Returns:
-            List of chunk dictionaries with 'text' and 'metadata'
+            List of chunk dictionaries with 'text' and 'metadata' (ChunkMeta)
         """
-        question = qa_item.get("instruction", "")
-        answer = qa_item.get("response", "")
-        category = qa_item.get("category", "unknown")
-        intent = qa_item.get("intent", "unknown")
-        flags = qa_item.get("flags", "")
+        question = qa_item.instruction
+        answer = qa_item.response
+        category = qa_item.category
+        intent = qa_item.intent
+        flags = qa_item.flags
 
         # Create full Q&A text
         qa_text = f"Q: {question}\nA: {answer}"
 
         # Check if it fits in single chunk
-        token_count = self.count_tokens(qa_text)
+        if token_count is None:
+            token_count = self.count_tokens(qa_text)
 
         if token_count <= self.max_tokens:
             # Single chunk - most common case
             return [{
                 "text": qa_text,
-                "metadata": {
-                    "category": category,
-                    "intent": intent,
-                    "flags": flags,
-                    "question": question,
-                    "token_count": token_count,
-                    "chunk_index": 0,
-                    "total_chunks": 1
-                }
+                "metadata": ChunkMeta(
+                    category=category,
+                    intent=intent,
+                    flags=flags,
+                    question=question,
+                    token_count=token_count,
+                    chunk_index=0,
+                    total_chunks=1
+                )
             }]
         else:
             # Split long answer into multiple chunks
@@ -102,15 +127,15 @@ class BitetChunker:
                 chunk_text = f"Q: {question}\nA: " + " ".join(current_chunk_sentences)
                 chunks.append({
                     "text": chunk_text,
-                    "metadata": {
-                        "category": category,
-                        "intent": intent,
-                        "flags": flags,
-                        "question": question,
-                        "token_count": self.count_tokens(chunk_text),
-                        "chunk_index": len(chunks),
-                        "total_chunks": -1  # Will update later
-                    }
+                    "metadata": ChunkMeta(
+                        category=category,
+                        intent=intent,
+                        flags=flags,
+                        question=question,
+                        token_count=self.count_tokens(chunk_text),
+                        chunk_index=len(chunks),
+                        total_chunks=-1  # Will update later
+                    )
                 })
 
                 # Start new chunk with overlap
@@ -130,21 +155,21 @@ class BitetChunker:
             chunk_text = f"Q: {question}\nA: " + " ".join(current_chunk_sentences)
             chunks.append({
                 "text": chunk_text,
-                "metadata": {
-                    "category": category,
-                    "intent": intent,
-                    "flags": flags,
-                    "question": question,
-                    "token_count": self.count_tokens(chunk_text),
-                    "chunk_index": len(chunks),
-                    "total_chunks": -1
-                }
+                "metadata": ChunkMeta(
+                    category=category,
+                    intent=intent,
+                    flags=flags,
+                    question=question,
+                    token_count=self.count_tokens(chunk_text),
+                    chunk_index=len(chunks),
+                    total_chunks=-1
+                )
             })
 
         # Update total_chunks count
         total = len(chunks)
         for chunk in chunks:
-            chunk["metadata"]["total_chunks"] = total
+            chunk["metadata"].total_chunks = total
 
         return chunks
 
@@ -159,23 +184,33 @@ class BitetChunker:
         sentences = re.split(r'(?<=[.!?])\s+', text)
         return [s.strip() for s in sentences if s.strip()]
 
-    def chunk_batch(self, qa_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def chunk_batch(self, qa_items: List[QAItem]) -> List[Dict[str, Any]]:
         """Chunk a batch of Q&A pairs.
 
         Args:
-            qa_items: List of Q&A dictionaries
+            qa_items: List of Q&A items
 
         Returns:
             Flat list of all chunks
         """
         all_chunks = []
 
-        for idx, qa_item in enumerate(qa_items):
-            chunks = self.chunk_qa_pair(qa_item)
+        # Tokenize in batches: tiktoken spreads encode_batch across threads
+        # with the GIL released, instead of one blocking encode per pair
+        token_counts = []
+        for start in range(0, len(qa_items), TOKENIZE_BATCH_SIZE):
+            texts = [
+                f"Q: {item.instruction}\nA: {item.response}"
+                for item in qa_items[start:start + TOKENIZE_BATCH_SIZE]
+            ]
+            token_counts.extend(len(tokens) for tokens in self.encoding.encode_batch(texts))
+
+        for idx, (qa_item, token_count) in enumerate(zip(qa_items, token_counts)):
+            chunks = self.chunk_qa_pair(qa_item, token_count)
 
             # Add source document ID to metadata
             for chunk in chunks:
-                chunk["metadata"]["source_doc_id"] = idx
+                chunk["metadata"].source_doc_id = idx
 
             all_chunks.extend(chunks)
 
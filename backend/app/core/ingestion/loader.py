@@ -1,15 +1,81 @@
 """Bitext dataset loader with CSV support and stratified splitting."""
-import csv
-import json
 import logging
+import gzip
 import hashlib
+import os
+import sys
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
-from collections import defaultdict
-import random
+from typing import List, Dict, Any, Iterator, Set, Tuple
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import lru_cache
+
+import orjson
+import numpy as np
+import pandas as pd
+import pyarrow as pa
 
 logger = logging.getLogger(__name__)
 
+# Dataset columns and the default used when a column is missing
+DATASET_COLUMNS = {
+    "flags": "",
+    "instruction": "",
+    "category": "unknown",
+    "intent": "unknown",
+    "response": "",
+}
+
+# Train/test split files (gzip-compressed JSON)
+TRAIN_SPLIT_FILE = "bitext_train.json.gz"
+TEST_SPLIT_FILE = "bitext_test_holdout.json.gz"
+
+# Uncompressed splits written by earlier versions. Still read when no
+# compressed split exists: the ingested chunks were built from them, and
+# re-splitting would not reproduce the same holdout.
+LEGACY_SPLIT_FILES = {
+    TRAIN_SPLIT_FILE: "bitext_train.json",
+    TEST_SPLIT_FILE: "bitext_test_holdout.json",
+}
+
+# Arrow-backed string dtype: .str methods dispatch to pyarrow.compute kernels
+ARROW_STRING = pd.ArrowDtype(pa.string())
+
+# Flag tag -> flag group lookup used by parse_flags
+FLAG_GROUPS = {
+    tag: group
+    for group, tags in (
+        ("lexical", "ML"),
+        ("syntactic", "BICN"),
+        ("register", "PQW"),
+        ("stylistic", "KEZ"),
+    )
+    for tag in tags
+}
+
+
+@dataclass(slots=True)
+class QAItem:
+    """A single Q&A pair from the dataset.
+
+    Field order matches DATASET_COLUMNS so rows can be built positionally.
+    """
+    flags: str
+    instruction: str
+    category: str
+    intent: str
+    response: str
+    source_id: str = ""
+    original_index: int = -1
+
+    def __post_init__(self):
+        # Only a few dozen distinct values across the dataset: interning
+        # shares one string object per value and makes dict keying cheap
+        self.flags = sys.intern(self.flags)
+        self.category = sys.intern(self.category)
+        self.intent = sys.intern(self.intent)
+
 
 class BitetDatasetLoader:
     """Loader for Bitext Customer Support dataset.
@@ -29,25 +95,31 @@ class BitetDatasetLoader:
         self.raw_data_path.mkdir(parents=True, exist_ok=True)
         self.use_csv = use_csv
 
+        # (category, intent) -> source_ids index for get_source_ids_by_category_intent,
+        # plus the items list it was built from
+        self._ci_index: Dict[Tuple[str, str], List[str]] = {}
+        self._ci_index_items: List[QAItem] = None
+
         if use_csv:
             self.dataset_file = self.raw_data_path / "bitext_customer_support.csv"
         else:
             self.dataset_file = self.raw_data_path / "bitext_customer_support.json"
 
-    def load_dataset(self) -> List[Dict[str, Any]]:
+    def load_dataset(self) -> List[QAItem]:
         """Load dataset from file (CSV or JSON).
 
         Returns:
-            List of Q&A dictionaries with schema:
-            {
-                "flags": str,           # Lexical/syntactic/register tags (e.g., "BQZ")
-                "instruction": str,     # Customer query/question
-                "category": str,        # High-level category (e.g., "ORDER")
-                "intent": str,          # Specific intent (e.g., "cancel_order")
-                "response": str         # Expected agent response
-            }
+            List of QAItem with fields:
+                flags: Lexical/syntactic/register tags (e.g., "BQZ")
+                instruction: Customer query/question
+                category: High-level category (e.g., "ORDER")
+                intent: Specific intent (e.g., "cancel_order")
+                response: Expected agent response
         """
-        if not self.dataset_file.exists():
+        # One stat() both checks existence and provides the cache key
+        try:
+            stat = self.dataset_file.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Dataset not found at {self.dataset_file}. "
                 f"Please place your bitext_customer_support.csv file in {self.raw_data_path}"
@@ -55,49 +127,43 @@ class BitetDatasetLoader:
 
         logger.info(f"Loading dataset from {self.dataset_file}")
 
-        if self.use_csv:
-            items = self._load_csv()
-        else:
-            items = self._load_json()
+        cached = _load_dataset_file(
+            str(self.dataset_file), stat.st_mtime_ns, stat.st_size, self.use_csv
+        )
+
+        # Copy rows so callers (e.g. add_source_ids) can't mutate the cache
+        items = [replace(item) for item in cached]
 
         logger.info(f"Loaded {len(items)} Q&A pairs from dataset")
 
         # Log sample statistics
         if items:
-            categories = set(item.get("category", "unknown") for item in items)
-            intents = set(item.get("intent", "unknown") for item in items)
-            flags_set = set(item.get("flags", "") for item in items if item.get("flags"))
-            logger.info(f"Dataset contains {len(categories)} categories, {len(intents)} intents, {len(flags_set)} unique flag combinations")
+            categories, intents, flags_dict, _ = self._compute_stats(items)
+            logger.info(f"Dataset contains {len(categories)} categories, {len(intents)} intents, {len(flags_dict)} unique flag combinations")
 
         return items
 
-    def _load_csv(self) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _load_csv(path: Path) -> List[QAItem]:
         """Load dataset from CSV file.
 
         CSV schema: flags,instruction,category,intent,response
         """
-        items = []
-
-        with open(self.dataset_file, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-
-            for row in reader:
-                # Clean up the row
-                item = {
-                    "flags": row.get("flags", "").strip(),
-                    "instruction": row.get("instruction", "").strip(),
-                    "category": row.get("category", "unknown").strip().upper(),
-                    "intent": row.get("intent", "unknown").strip().lower(),
-                    "response": row.get("response", "").strip()
-                }
-                items.append(item)
-
-        return items
+        # pyarrow engine: multithreaded C++ tokenizer, Arrow-backed string columns
+        df = pd.read_csv(
+            path,
+            engine="pyarrow",
+            dtype=ARROW_STRING,
+            keep_default_na=False,
+            encoding="utf-8",
+        )
+        return BitetDatasetLoader._normalize_frame(df)
 
-    def _load_json(self) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _load_json(path: Path) -> List[QAItem]:
         """Load dataset from JSON file (fallback, may not have flags)."""
-        with open(self.dataset_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
 
         # Handle different possible JSON structures
         if isinstance(data, list):
@@ -107,31 +173,97 @@ class BitetDatasetLoader:
         else:
             items = list(data.values()) if isinstance(data, dict) else []
 
-        # Normalize schema to match CSV
-        normalized = []
-        for item in items:
-            normalized.append({
-                "flags": item.get("flags", ""),
-                "instruction": item.get("instruction", item.get("question", "")),
-                "category": item.get("category", "unknown").upper(),
-                "intent": item.get("intent", "unknown").lower(),
-                "response": item.get("response", item.get("answer", ""))
-            })
+        df = pd.DataFrame(items)
+
+        # Some JSON exports use question/answer instead of instruction/response
+        for column, alias in (("instruction", "question"), ("response", "answer")):
+            if alias in df.columns:
+                df[column] = df[column].fillna(df[alias]) if column in df.columns else df[alias]
+
+        return BitetDatasetLoader._normalize_frame(df)
+
+    @staticmethod
+    def _normalize_frame(df: pd.DataFrame) -> List[QAItem]:
+        """Normalize a raw dataset frame to the loader schema.
+
+        Columns are cast to Arrow-backed strings so strip/upper/lower run as
+        pyarrow.compute kernels; rows are only converted to QAItem at the end.
+
+        Args:
+            df: Raw dataset rows
+
+        Returns:
+            List of QAItem
+        """
+        for column, default in DATASET_COLUMNS.items():
+            if column in df.columns:
+                values = df[column].fillna(default)
+                if values.dtype != ARROW_STRING:
+                    values = values.astype(str).astype(ARROW_STRING)
+                df[column] = values.str.strip()
+            else:
+                df[column] = default
+
+        df["category"] = df["category"].str.upper()
+        df["intent"] = df["intent"].str.lower()
+
+        rows = df[list(DATASET_COLUMNS)].itertuples(index=False, name=None)
+        return [QAItem(*row) for row in rows]
+
+    def iter_items(self, chunksize: int = 5000) -> Iterator[QAItem]:
+        """Stream the dataset without materializing it all at once.
+
+        CSV files are parsed and normalized chunksize rows at a time, so peak
+        memory is bounded by the chunk rather than the dataset. JSON has no
+        streaming parser here and is loaded whole. Items are yielded with
+        source_id and original_index already assigned.
+
+        Args:
+            chunksize: Rows per CSV chunk
+
+        Yields:
+            QAItem for each row in file order
+
+        Raises:
+            FileNotFoundError: If dataset file doesn't exist
+        """
+        if not self.dataset_file.exists():
+            raise FileNotFoundError(
+                f"Dataset not found at {self.dataset_file}. "
+                f"Please place your bitext_customer_support.csv file in {self.raw_data_path}"
+            )
+
+        if self.use_csv:
+            chunks = (
+                self._normalize_frame(chunk)
+                for chunk in pd.read_csv(
+                    self.dataset_file,
+                    chunksize=chunksize,
+                    dtype=str,
+                    keep_default_na=False,
+                    encoding="utf-8",
+                )
+            )
+        else:
+            chunks = iter([self._load_json(self.dataset_file)])
 
-        return normalized
+        offset = 0
+        for items in chunks:
+            yield from self.add_source_ids(items, start=offset)
+            offset += len(items)
 
-    def load(self) -> List[Dict[str, Any]]:
+    def load(self) -> List[QAItem]:
         """Load dataset from local file.
 
         Returns:
-            List of Q&A dictionaries
+            List of QAItem
 
         Raises:
             FileNotFoundError: If dataset file doesn't exist
         """
         return self.load_dataset()
 
-    def get_dataset_stats(self, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def get_dataset_stats(self, items: List[QAItem]) -> Dict[str, Any]:
         """Get comprehensive statistics about the dataset.
 
         Args:
@@ -143,60 +275,62 @@ class BitetDatasetLoader:
         if not items:
             return {"total": 0}
 
-        categories = {}
-        intents = {}
-        flags_dict = {}
-        flag_tags = {
-            # Lexical
-            "M": 0,  # Morphological
-            "L": 0,  # Semantic
-            # Syntactic
-            "B": 0,  # Basic
-            "I": 0,  # Interrogative
-            "C": 0,  # Coordinated
-            "N": 0,  # Negation
-            # Register
-            "P": 0,  # Politeness
-            "Q": 0,  # Colloquial
-            "W": 0,  # Offensive
-            # Stylistic
-            "K": 0,  # Keyword
-            "E": 0,  # Abbreviations
-            "Z": 0,  # Errors/Typos
-        }
-
-        for item in items:
-            category = item.get("category", "unknown")
-            intent = item.get("intent", "unknown")
-            flags = item.get("flags", "")
-
-            categories[category] = categories.get(category, 0) + 1
-            intents[intent] = intents.get(intent, 0) + 1
+        categories, intents, flags_dict, tag_counts = self._compute_stats(items)
 
-            if flags:
-                flags_dict[flags] = flags_dict.get(flags, 0) + 1
-                # Count individual flag tags
-                for tag in flags:
-                    if tag in flag_tags:
-                        flag_tags[tag] += 1
+        # Known flag tags only (lexical, syntactic, register, stylistic)
+        flag_tags = Counter({tag: tag_counts[tag] for tag in FLAG_GROUPS})
 
         return {
             "total": len(items),
             "categories": {
                 "count": len(categories),
-                "breakdown": sorted(categories.items(), key=lambda x: x[1], reverse=True)
+                "breakdown": categories.most_common()
             },
             "intents": {
                 "count": len(intents),
-                "top_10": sorted(intents.items(), key=lambda x: x[1], reverse=True)[:10]
+                "top_10": intents.most_common(10)
             },
             "flags": {
                 "unique_combinations": len(flags_dict),
-                "top_10": sorted(flags_dict.items(), key=lambda x: x[1], reverse=True)[:10],
-                "tag_distribution": sorted(flag_tags.items(), key=lambda x: x[1], reverse=True)
+                "top_10": flags_dict.most_common(10),
+                "tag_distribution": flag_tags.most_common()
             }
         }
 
+    @staticmethod
+    def _compute_stats(
+        items: List[QAItem]
+    ) -> Tuple[Counter, Counter, Counter, Counter]:
+        """Count categories, intents, flag combinations and flag tags.
+
+        Args:
+            items: List of Q&A items
+
+        Returns:
+            Tuple of (categories, intents, flag_combinations, flag_tags) counters
+        """
+        categories = Counter()
+        intents = Counter()
+        flags_dict = Counter()
+        tag_counts = Counter()
+
+        for item in items:
+            categories[item.category] += 1
+            intents[item.intent] += 1
+
+            flags = item.flags
+            if flags:
+                flags_dict[flags] += 1
+
+        # Tag counts follow from the combination counts: there are only a
+        # few hundred distinct flag strings, so weight each one's tags by its
+        # count instead of walking every item's flags character by character
+        for flags, count in flags_dict.items():
+            for tag in flags:
+                tag_counts[tag] += count
+
+        return categories, intents, flags_dict, tag_counts
+
     def parse_flags(self, flags: str) -> Dict[str, List[str]]:
         """Parse flag string into categories.
 
@@ -212,52 +346,48 @@ class BitetDatasetLoader:
                 "stylistic": ["K", "E", "Z"]
             }
         """
-        lexical = []
-        syntactic = []
-        register = []
-        stylistic = []
+        parsed = {
+            "lexical": [],
+            "syntactic": [],
+            "register": [],
+            "stylistic": []
+        }
 
         for tag in flags:
-            if tag in ["M", "L"]:
-                lexical.append(tag)
-            elif tag in ["B", "I", "C", "N"]:
-                syntactic.append(tag)
-            elif tag in ["P", "Q", "W"]:
-                register.append(tag)
-            elif tag in ["K", "E", "Z"]:
-                stylistic.append(tag)
+            group = FLAG_GROUPS.get(tag)
+            if group is not None:
+                parsed[group].append(tag)
 
-        return {
-            "lexical": lexical,
-            "syntactic": syntactic,
-            "register": register,
-            "stylistic": stylistic
-        }
+        return parsed
 
-    def add_source_ids(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def add_source_ids(self, items: List[QAItem], start: int = 0) -> List[QAItem]:
         """Add unique source_id to each item for tracking.
 
         Args:
             items: List of Q&A items
+            start: original_index of the first item (for chunked loading)
 
         Returns:
             Items with source_id added
         """
-        for i, item in enumerate(items):
-            # Create unique ID from content hash
-            content = f"{item['instruction']}|{item['response']}"
-            source_id = hashlib.md5(content.encode()).hexdigest()[:12]
-            item["source_id"] = f"doc_{source_id}"
-            item["original_index"] = i
+        blake2b = hashlib.blake2b
+
+        for i, item in enumerate(items, start):
+            # Create unique ID from content hash (6-byte digest = 12 hex chars)
+            h = blake2b(item.instruction.encode(), digest_size=6)
+            h.update(b"|")
+            h.update(item.response.encode())
+            item.source_id = "doc_" + h.hexdigest()
+            item.original_index = i
 
         return items
 
     def stratified_split(
         self,
-        items: List[Dict[str, Any]],
+        items: List[QAItem],
         test_size: float = 0.2,
         random_seed: int = 42
-    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    ) -> Tuple[List[QAItem], List[QAItem]]:
         """Split dataset into train/test with stratification by category+intent.
 
         Ensures both sets have proportional representation of all category/intent combos.
@@ -270,30 +400,37 @@ class BitetDatasetLoader:
         Returns:
             Tuple of (train_items, test_items)
         """
-        random.seed(random_seed)
-
-        # Group items by stratification key (category + intent)
-        groups = defaultdict(list)
-        for item in items:
-            strat_key = f"{item.get('category', 'unknown')}_{item.get('intent', 'unknown')}"
-            groups[strat_key].append(item)
+        # Map each (category, intent) pair to an integer group code, then
+        # sort indices by code so each group is a contiguous slice of `order`
+        group_codes = {}
+        keys = np.array(
+            [group_codes.setdefault((item.category, item.intent), len(group_codes)) for item in items],
+            dtype=np.int64,
+        )
+        order = np.argsort(keys, kind="stable")
+        _, starts, counts = np.unique(keys[order], return_index=True, return_counts=True)
 
-        train_items = []
-        test_items = []
+        rng = np.random.default_rng(random_seed)
+        train_indices = []
+        test_indices = []
 
         # Split each group proportionally
-        for strat_key, group_items in groups.items():
-            random.shuffle(group_items)
+        for start, count in zip(starts, counts):
+            group = order[start:start + count]
+            rng.shuffle(group)
 
             # Calculate split point
-            n_test = max(1, int(len(group_items) * test_size))
+            n_test = max(1, int(count * test_size))
 
             # Ensure at least 1 in train if group has more than 1 item
-            if len(group_items) > 1 and n_test >= len(group_items):
-                n_test = len(group_items) - 1
+            if count > 1 and n_test >= count:
+                n_test = count - 1
+
+            test_indices.extend(group[:n_test].tolist())
+            train_indices.extend(group[n_test:].tolist())
 
-            test_items.extend(group_items[:n_test])
-            train_items.extend(group_items[n_test:])
+        train_items = [items[i] for i in train_indices]
+        test_items = [items[i] for i in test_indices]
 
         logger.info(
             f"Stratified split: {len(train_items)} train, {len(test_items)} test "
@@ -304,9 +441,9 @@ class BitetDatasetLoader:
         train_categories = defaultdict(int)
         test_categories = defaultdict(int)
         for item in train_items:
-            train_categories[item.get("category", "unknown")] += 1
+            train_categories[item.category] += 1
         for item in test_items:
-            test_categories[item.get("category", "unknown")] += 1
+            test_categories[item.category] += 1
 
         logger.info(f"Train categories: {dict(train_categories)}")
         logger.info(f"Test categories: {dict(test_categories)}")
@@ -315,8 +452,8 @@ class BitetDatasetLoader:
 
     def save_split(
         self,
-        train_items: List[Dict[str, Any]],
-        test_items: List[Dict[str, Any]],
+        train_items: List[QAItem],
+        test_items: List[QAItem],
         output_dir: str = None
     ) -> Tuple[Path, Path]:
         """Save train and test splits to separate files.
@@ -331,24 +468,40 @@ class BitetDatasetLoader:
         """
         output_dir = Path(output_dir) if output_dir else self.raw_data_path
 
-        train_file = output_dir / "bitext_train.json"
-        test_file = output_dir / "bitext_test_holdout.json"
+        train_file = output_dir / TRAIN_SPLIT_FILE
+        test_file = output_dir / TEST_SPLIT_FILE
 
-        with open(train_file, "w", encoding="utf-8") as f:
-            json.dump(train_items, f, indent=2)
-        logger.info(f"Saved {len(train_items)} training items to {train_file}")
+        # The two files are independent, so write them concurrently;
+        # result() re-raises any write error
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self._write_split, train_file, train_items),
+                executor.submit(self._write_split, test_file, test_items),
+            ]
+            for future in futures:
+                future.result()
 
-        with open(test_file, "w", encoding="utf-8") as f:
-            json.dump(test_items, f, indent=2)
+        logger.info(f"Saved {len(train_items)} training items to {train_file}")
         logger.info(f"Saved {len(test_items)} test items to {test_file}")
 
         return train_file, test_file
 
+    @staticmethod
+    def _write_split(path: Path, items: List[QAItem]) -> None:
+        """Write one split as gzip-compressed JSON.
+
+        orjson serializes dataclasses (including slots) natively. Level 1
+        compression is much faster than the default and still shrinks the
+        file several times over.
+        """
+        with gzip.open(path, "wb", compresslevel=1) as f:
+            f.write(orjson.dumps(items))
+
     def load_split(
         self,
         split: str = "train",
         output_dir: str = None
-    ) -> List[Dict[str, Any]]:
+    ) -> List[QAItem]:
         """Load a previously saved split.
 
         Args:
@@ -361,29 +514,38 @@ class BitetDatasetLoader:
         output_dir = Path(output_dir) if output_dir else self.raw_data_path
 
         if split == "train":
-            file_path = output_dir / "bitext_train.json"
+            file_name = TRAIN_SPLIT_FILE
         elif split == "test":
-            file_path = output_dir / "bitext_test_holdout.json"
+            file_name = TEST_SPLIT_FILE
         else:
             raise ValueError(f"Invalid split: {split}. Use 'train' or 'test'")
 
+        file_path = output_dir / file_name
+        if not file_path.exists():
+            file_path = output_dir / LEGACY_SPLIT_FILES[file_name]
         if not file_path.exists():
             raise FileNotFoundError(
-                f"Split file not found: {file_path}. Run stratified_split() first."
+                f"Split file not found: {output_dir / file_name}. Run stratified_split() first."
             )
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            items = json.load(f)
+        opener = gzip.open if file_path.suffix == ".gz" else open
+        with opener(file_path, "rb") as f:
+            items = [QAItem(**row) for row in orjson.loads(f.read())]
 
         logger.info(f"Loaded {len(items)} items from {split} split")
         return items
 
+    def _existing_files(self) -> Set[str]:
+        """List regular files in raw_data_path with a single directory read."""
+        with os.scandir(self.raw_data_path) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+
     def load_and_split(
         self,
         test_size: float = 0.2,
         random_seed: int = 42,
         force_resplit: bool = False
-    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    ) -> Tuple[List[QAItem], List[QAItem]]:
         """Load dataset, add source IDs, and split into train/test.
 
         This is the main method to use for preparing data for RAG + evaluation.
@@ -399,11 +561,13 @@ class BitetDatasetLoader:
         Raises:
             FileNotFoundError: If dataset file doesn't exist
         """
-        train_file = self.raw_data_path / "bitext_train.json"
-        test_file = self.raw_data_path / "bitext_test_holdout.json"
+        existing_files = self._existing_files()
 
-        # Use cached splits if available
-        if train_file.exists() and test_file.exists() and not force_resplit:
+        # Use cached splits (compressed or legacy) if available
+        if not force_resplit and all(
+            name in existing_files or LEGACY_SPLIT_FILES[name] in existing_files
+            for name in (TRAIN_SPLIT_FILE, TEST_SPLIT_FILE)
+        ):
             logger.info("Loading existing train/test splits")
             train_items = self.load_split("train")
             test_items = self.load_split("test")
@@ -429,13 +593,15 @@ class BitetDatasetLoader:
 
     def get_source_ids_by_category_intent(
         self,
-        items: List[Dict[str, Any]],
+        items: List[QAItem],
         category: str,
         intent: str
     ) -> List[str]:
         """Get all source_ids matching a category and intent.
 
-        Useful for finding relevant docs during evaluation.
+        Useful for finding relevant docs during evaluation. The first call
+        for a given items list builds an index; later calls with the same
+        list are dict lookups.
 
         Args:
             items: List of items (typically training set)
@@ -445,10 +611,37 @@ class BitetDatasetLoader:
         Returns:
             List of source_ids
         """
-        return [
-            item["source_id"]
-            for item in items
-            if item.get("category", "").upper() == category.upper()
-            and item.get("intent", "").lower() == intent.lower()
-            and "source_id" in item
-        ]
+        if items is not self._ci_index_items:
+            self._build_category_intent_index(items)
+
+        return list(self._ci_index.get((category.upper(), intent.lower()), ()))
+
+    def _build_category_intent_index(self, items: List[QAItem]) -> None:
+        """Index source_ids by (upper category, lower intent) for items."""
+        index = defaultdict(list)
+
+        for item in items:
+            if item.source_id:
+                index[(item.category.upper(), item.intent.lower())].append(item.source_id)
+
+        self._ci_index = dict(index)
+        self._ci_index_items = items
+
+
+@lru_cache(maxsize=4)
+def _load_dataset_file(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    use_csv: bool
+) -> Tuple[QAItem, ...]:
+    """Parse a dataset file once per (path, mtime, size).
+
+    mtime_ns and size are only part of the cache key, so editing or
+    replacing the file invalidates the cached rows.
+    """
+    if use_csv:
+        items = BitetDatasetLoader._load_csv(Path(path))
+    else:
+        items = BitetDatasetLoader._load_json(Path(path))
+    return tuple(items)
@@ -1,4 +1,5 @@
 """Retrieval system with scoring."""
+import asyncio
 import logging
 from typing import List, Dict, Any, Optional
 
@@ -47,6 +48,33 @@ class RAGRetriever:
         logger.info(f"Retrieved {len(results)} documents for query")
         return results
 
+    async def retrieve_batch(
+        self,
+        queries: List[str],
+        top_k: int = None,
+        filter_metadata: Optional[Dict[str, Any]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """Retrieve relevant documents for several queries in one round trip.
+
+        Args:
+            queries: Query strings
+            top_k: Number of results per query
+            filter_metadata: Optional metadata filter
+
+        Returns:
+            One list of retrieved documents per query, in input order
+        """
+        top_k = top_k or settings.top_k
+
+        results = await self.vector_store.query_batch(
+            query_texts=queries,
+            top_k=top_k,
+            filter_metadata=filter_metadata
+        )
+
+        logger.info(f"Retrieved documents for {len(queries)} queries")
+        return results
+
     async def generate_response(
         self,
         query: str,
@@ -68,15 +96,28 @@ class RAGRetriever:
         # Create RAG prompt
         rag_prompt = create_rag_prompt(query, contexts)
 
-        # Select generator
+        generator = self._get_generator(llm_provider)
+        return await generator.generate(rag_prompt)
+
+    def _get_generator(self, llm_provider: str = None):
+        """Resolve the generator for an LLM provider.
+
+        Args:
+            llm_provider: "anthropic" or "openai" (defaults to settings)
+
+        Returns:
+            ClaudeGenerator or OpenAIGenerator
+
+        Raises:
+            ValueError: If the provider is unknown
+        """
+        llm_provider = llm_provider or settings.default_llm_provider
+
         if llm_provider == "anthropic":
-            result = await self.claude_generator.generate(rag_prompt)
+            return self.claude_generator
         elif llm_provider == "openai":
-            result = await self.openai_generator.generate(rag_prompt)
-        else:
-            raise ValueError(f"Unknown LLM provider: {llm_provider}")
-
-        return result
+            return self.openai_generator
+        raise ValueError(f"Unknown LLM provider: {llm_provider}")
 
     async def query(
         self,
@@ -98,6 +139,9 @@ class RAGRetriever:
         """
         logger.info(f"Processing RAG query: '{query_text}'")
 
+        # Validate the provider before paying for embedding + search
+        self._get_generator(llm_provider)
+
         # Step 1: Retrieve relevant documents
         sources = await self.retrieve(
             query=query_text,
@@ -105,6 +149,64 @@ class RAGRetriever:
             filter_metadata=filter_metadata
         )
 
+        return await self._answer(query_text, sources, llm_provider)
+
+    async def query_batch(
+        self,
+        query_texts: List[str],
+        top_k: int = None,
+        llm_provider: str = None,
+        filter_metadata: Optional[Dict[str, Any]] = None
+    ) -> List[Any]:
+        """Run the RAG pipeline for several queries.
+
+        Retrieval for all queries is a single batched vector store call;
+        generation then runs concurrently.
+
+        Args:
+            query_texts: User questions
+            top_k: Number of documents to retrieve per query
+            llm_provider: LLM to use for generation
+            filter_metadata: Optional metadata filter
+
+        Returns:
+            One entry per query, in input order: the RAG result dict, or the
+            exception raised while generating that query's response
+        """
+        logger.info(f"Processing {len(query_texts)} RAG queries")
+
+        self._get_generator(llm_provider)
+
+        all_sources = await self.retrieve_batch(
+            queries=query_texts,
+            top_k=top_k,
+            filter_metadata=filter_metadata
+        )
+
+        return await asyncio.gather(
+            *[
+                self._answer(query_text, sources, llm_provider)
+                for query_text, sources in zip(query_texts, all_sources)
+            ],
+            return_exceptions=True
+        )
+
+    async def _answer(
+        self,
+        query_text: str,
+        sources: List[Dict[str, Any]],
+        llm_provider: str = None
+    ) -> Dict[str, Any]:
+        """Generate a response from retrieved sources and build the RAG result.
+
+        Args:
+            query_text: User's question
+            sources: Retrieved context documents
+            llm_provider: LLM to use for generation
+
+        Returns:
+            Complete RAG result with response, sources, and metadata
+        """
         if not sources:
             logger.warning("No sources retrieved for query")
             return {
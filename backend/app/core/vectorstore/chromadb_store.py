@@ -1,13 +1,49 @@
 """ChromaDB vector store integration."""
+import asyncio
+import functools
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, is_dataclass
+from typing import List, Dict, Any, Optional, Set
 import chromadb
+import numpy as np
 
 from app.config import settings
 from app.core.embeddings.openai_embeddings import OpenAIEmbeddings
 
 logger = logging.getLogger(__name__)
 
+# Cosine space makes distances lie in [0, 2] so 1 - distance is cosine
+# similarity. HNSW parameters trade build time and memory for recall.
+# Only applies when a collection is created; existing collections must be
+# reset to pick it up.
+COLLECTION_METADATA = {
+    "description": "Bitext customer support Q&A pairs",
+    "hnsw:space": "cosine",
+    "hnsw:M": settings.hnsw_m,
+    "hnsw:construction_ef": settings.hnsw_construction_ef,
+    "hnsw:search_ef": settings.hnsw_search_ef,
+}
+
+# Only the fields results are built from; never ship embeddings back
+QUERY_INCLUDE = ["documents", "metadatas", "distances"]
+
+# Dedicated pool for blocking ChromaDB calls. Chroma releases the GIL in
+# its native core, so searches and writes run in parallel with the event
+# loop; the pool bound keeps HNSW writes from swamping the disk.
+_chroma_pool = ThreadPoolExecutor(
+    max_workers=settings.chroma_max_workers,
+    thread_name_prefix="chroma"
+)
+
+
+async def _run_in_pool(fn, **kwargs):
+    """Run a blocking ChromaDB call on the dedicated pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_chroma_pool, functools.partial(fn, **kwargs))
+
 
 class ChromaDBStore:
     """ChromaDB vector store for RAG retrieval."""
@@ -26,30 +62,60 @@ class ChromaDBStore:
         self.collection_name = collection_name
         self.persist_directory = persist_directory or settings.chromadb_path
 
-        # Initialize ChromaDB client with persistence
-        self.client = chromadb.PersistentClient(path=self.persist_directory)
+        # Initialize ChromaDB client with persistence (shared per directory)
+        self.client = self.get_client(self.persist_directory)
 
         # Get or create collection
         self.collection = self.client.get_or_create_collection(
             name=self.collection_name,
-            metadata={"description": "Bitext customer support Q&A pairs"}
+            metadata=COLLECTION_METADATA
         )
 
-        # Initialize embeddings
-        self.embeddings = OpenAIEmbeddings()
-
         logger.info(f"Initialized ChromaDB collection '{self.collection_name}' at {self.persist_directory}")
 
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_client(persist_directory: str) -> chromadb.ClientAPI:
+        """Return the process-wide ChromaDB client for a directory.
+
+        Stores opened on the same directory share one client, and with it
+        one SQLite handle.
+
+        Args:
+            persist_directory: Directory to persist ChromaDB data
+
+        Returns:
+            Persistent ChromaDB client
+        """
+        return chromadb.PersistentClient(path=persist_directory)
+
+    @functools.cached_property
+    def embeddings(self) -> OpenAIEmbeddings:
+        """Embeddings client, created on first use.
+
+        Stats and reset calls never embed, so they skip the setup cost.
+        """
+        return OpenAIEmbeddings()
+
     async def add_documents(
         self,
         chunks: List[Dict[str, Any]],
-        batch_size: int = 100
+        batch_size: int = 100,
+        max_in_flight: int = 3,
+        write_batch_size: int = 5000
     ) -> int:
         """Add document chunks to the vector store.
 
         Args:
             chunks: List of chunk dictionaries with 'text' and 'metadata'
             batch_size: Batch size for embedding generation
+            max_in_flight: Maximum embedding batches requested ahead of the writes
+            write_batch_size: Rows per collection write (kept under
+                ChromaDB's maximum batch size)
+
+        Chunk IDs are content hashes, so chunks already in the collection
+        (e.g. from a previous ingestion run) are skipped without being
+        re-embedded.
 
         Returns:
             Number of chunks added
@@ -57,33 +123,138 @@ class ChromaDBStore:
         if not chunks:
             return 0
 
-        logger.info(f"Adding {len(chunks)} chunks to ChromaDB...")
+        # Deduplicate by content ID, keeping the first occurrence
+        unique = {}
+        for chunk in chunks:
+            unique.setdefault(self.chunk_id(chunk["text"]), chunk)
+
+        # Skip chunks that are already embedded
+        candidate_ids = list(unique)
+        existing = set()
+        for i in range(0, len(candidate_ids), write_batch_size):
+            found = await _run_in_pool(
+                self.collection.get, ids=candidate_ids[i:i + write_batch_size], include=[]
+            )
+            existing.update(found["ids"])
+
+        ids = [chunk_id for chunk_id in candidate_ids if chunk_id not in existing]
+
+        logger.info(
+            f"Adding {len(ids)} chunks to ChromaDB "
+            f"({len(existing)} already present, {len(chunks) - len(unique)} duplicates)..."
+        )
+
+        chunks = [unique[chunk_id] for chunk_id in ids]
+        if not chunks:
+            return 0
 
         # Extract texts for embedding
         texts = [chunk["text"] for chunk in chunks]
+        batch_starts = range(0, len(chunks), batch_size)
+        num_batches = len(batch_starts)
+
+        # Embedding runs up to max_in_flight batches ahead of the ChromaDB
+        # writes, so OpenAI latency overlaps with HNSW insertion and only a
+        # few write batches of vectors are resident at once
+        in_flight = deque()
+        next_batch = 0
+
+        # Embedded vectors accumulate until write_batch_size rows are ready,
+        # so each write (one SQLite transaction) covers many
+        # embedding batches
+        write_start = 0
+        pending_embeddings = []
+
+        try:
+            for i in batch_starts:
+                while next_batch < num_batches and len(in_flight) < max_in_flight:
+                    start = batch_starts[next_batch]
+                    in_flight.append(asyncio.create_task(
+                        self.embeddings.embed_batch(texts[start:start + batch_size], batch_size=batch_size)
+                    ))
+                    next_batch += 1
+
+                pending_embeddings.append(await in_flight.popleft())
+                end_idx = min(i + batch_size, len(chunks))
+
+                if end_idx - write_start < write_batch_size and end_idx < len(chunks):
+                    continue
+
+                # ChromaDB only accepts plain dict metadata
+                metadatas = [
+                    asdict(chunk["metadata"]) if is_dataclass(chunk["metadata"]) else chunk["metadata"]
+                    for chunk in chunks[write_start:end_idx]
+                ]
+
+                # Blocking write; run it off the event loop so in-flight
+                # embedding requests keep progressing. upsert tolerates IDs
+                # added concurrently since the existence check
+                await _run_in_pool(
+                    self.collection.upsert,
+                    ids=ids[write_start:end_idx],
+                    embeddings=np.concatenate(pending_embeddings),
+                    documents=texts[write_start:end_idx],
+                    metadatas=metadatas
+                )
+
+                logger.info(f"Added {end_idx}/{len(chunks)} chunks")
+                write_start = end_idx
+                pending_embeddings = []
+        finally:
+            for task in in_flight:
+                task.cancel()
 
-        # Generate embeddings in batches
-        embeddings = await self.embeddings.embed_batch(texts, batch_size=batch_size)
+        logger.info(f"Successfully added {len(chunks)} chunks to ChromaDB")
+        return len(chunks)
 
-        # Prepare data for ChromaDB
-        ids = [f"chunk_{i}" for i in range(len(chunks))]
-        metadatas = [chunk["metadata"] for chunk in chunks]
+    async def warm_up(self) -> None:
+        """Load the collection's HNSW index before the first real query.
 
-        # Add to collection in batches
-        for i in range(0, len(chunks), batch_size):
-            end_idx = min(i + batch_size, len(chunks))
+        Queries with a placeholder vector rather than an embedded string,
+        so startup makes no OpenAI call. Failures are logged, not raised;
+        the first real query would then pay the load instead.
+        """
+        probe = np.zeros((1, settings.embedding_dimensions), dtype=np.float32)
+        probe[0, 0] = 1.0
+        try:
+            if await _run_in_pool(self.collection.count) == 0:
+                return
+            await _run_in_pool(self.collection.query, query_embeddings=probe, n_results=1, include=[])
+            logger.info(f"Warmed up ChromaDB collection '{self.collection_name}'")
+        except Exception as e:
+            logger.warning(f"ChromaDB warm-up failed: {e}")
+
+    @staticmethod
+    def chunk_id(text: str) -> str:
+        """Deterministic chunk ID derived from the chunk text.
 
-            self.collection.add(
-                ids=ids[i:end_idx],
-                embeddings=embeddings[i:end_idx],
-                documents=texts[i:end_idx],
-                metadatas=metadatas[i:end_idx]
-            )
+        Args:
+            text: Chunk text
 
-            logger.info(f"Added batch {i // batch_size + 1}/{(len(chunks) - 1) // batch_size + 1}")
+        Returns:
+            32-character hex digest
+        """
+        return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
 
-        logger.info(f"Successfully added {len(chunks)} chunks to ChromaDB")
-        return len(chunks)
+    def delete_stale(self, keep_ids: Set[str]) -> int:
+        """Delete chunks whose IDs are not in keep_ids.
+
+        Args:
+            keep_ids: IDs of the chunks that should remain
+
+        Returns:
+            Number of chunks deleted
+        """
+        stale_ids = [
+            chunk_id for chunk_id in self.collection.get(include=[])["ids"]
+            if chunk_id not in keep_ids
+        ]
+
+        if stale_ids:
+            self.collection.delete(ids=stale_ids)
+            logger.info(f"Deleted {len(stale_ids)} stale chunks from ChromaDB")
+
+        return len(stale_ids)
 
     async def query(
         self,
@@ -103,31 +274,164 @@ class ChromaDBStore:
         """
         top_k = top_k or settings.top_k
 
-        # Generate query embedding
-        query_embedding = await self.embeddings.embed_text(query_text)
+        # Generate query embedding (cached for repeated queries)
+        query_embedding = (await self.embeddings.embed_queries([query_text]))[0]
+
+        formatted_results = (await self._search([query_embedding], top_k, filter_metadata))[0]
+
+        logger.info(f"Retrieved {len(formatted_results)} results for query")
+        return formatted_results
+
+    async def query_batch(
+        self,
+        query_texts: List[str],
+        top_k: int = None,
+        filter_metadata: Optional[Dict[str, Any]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """Query the vector store for several queries at once.
+
+        Embeds all uncached queries in one embeddings call and runs a
+        single ChromaDB query over the batch.
+
+        Args:
+            query_texts: Query strings
+            top_k: Number of results per query (defaults to settings)
+            filter_metadata: Optional metadata filter applied to every query
+
+        Returns:
+            One result list per query, in input order
+        """
+        if not query_texts:
+            return []
+
+        top_k = top_k or settings.top_k
+
+        query_embeddings = await self.embeddings.embed_queries(query_texts)
 
-        # Query ChromaDB
-        results = self.collection.query(
-            query_embeddings=[query_embedding],
-            n_results=top_k,
-            where=filter_metadata  # Metadata filtering
+        formatted_results = await self._search(query_embeddings, top_k, filter_metadata)
+
+        logger.info(f"Retrieved results for {len(query_texts)} queries")
+        return formatted_results
+
+    async def _search(
+        self,
+        query_embeddings: List[np.ndarray],
+        top_k: int,
+        filter_metadata: Optional[Dict[str, Any]]
+    ) -> List[List[Dict[str, Any]]]:
+        """Run one ChromaDB search for a batch of query embeddings.
+
+        When settings.mmr_lambda is set, mmr_fetch_factor * top_k candidates
+        are fetched per query and reranked with maximal marginal relevance
+        to drop near-duplicate chunks.
+
+        Args:
+            query_embeddings: Query embedding vectors
+            top_k: Number of results per query
+            filter_metadata: Optional metadata filter
+
+        Returns:
+            One result list per query, in input order
+        """
+        mmr_lambda = settings.mmr_lambda
+        n_results = top_k * settings.mmr_fetch_factor if mmr_lambda is not None else top_k
+
+        # Blocking HNSW search, run off the event loop. A multi-embedding
+        # query is parallelized inside ChromaDB.
+        results = await _run_in_pool(
+            self.collection.query,
+            query_embeddings=np.stack(query_embeddings),
+            n_results=n_results,
+            where=filter_metadata,  # Metadata filtering
+            include=(QUERY_INCLUDE + ["embeddings"]) if mmr_lambda is not None else QUERY_INCLUDE
         )
 
-        # Format results
         formatted_results = []
 
-        for i in range(len(results["ids"][0])):
-            formatted_results.append({
-                "id": results["ids"][0][i],
-                "text": results["documents"][0][i],
-                "metadata": results["metadatas"][0][i],
-                "score": 1.0 - results["distances"][0][i],  # Convert distance to similarity
-                "distance": results["distances"][0][i]
-            })
+        for q in range(len(query_embeddings)):
+            hits = self._format_results(results, q)
+
+            if mmr_lambda is not None and len(hits) > top_k:
+                selected = self._mmr_select(
+                    results["embeddings"][q],
+                    [hit["score"] for hit in hits],
+                    top_k,
+                    mmr_lambda
+                )
+                hits = [hits[i] for i in selected]
+
+            formatted_results.append(hits)
 
-        logger.info(f"Retrieved {len(formatted_results)} results for query")
         return formatted_results
 
+    @staticmethod
+    def _mmr_select(
+        embeddings: List[List[float]],
+        query_similarities: List[float],
+        k: int,
+        mmr_lambda: float
+    ) -> List[int]:
+        """Pick k candidates by maximal marginal relevance.
+
+        Each step takes the candidate maximizing
+        lambda * sim(query, c) - (1 - lambda) * max sim(c, selected).
+        OpenAI embeddings are unit-normalized, so dot products are cosine
+        similarities.
+
+        Args:
+            embeddings: Candidate embeddings
+            query_similarities: Candidate similarity to the query
+            k: Number of candidates to select
+            mmr_lambda: Relevance/diversity trade-off (1.0 = pure relevance)
+
+        Returns:
+            Indices of the selected candidates, in selection order
+        """
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        relevance = mmr_lambda * np.asarray(query_similarities, dtype=np.float32)
+
+        # Candidate x candidate similarity, computed once
+        pairwise = vectors @ vectors.T
+
+        # The most relevant candidate always goes first
+        first = int(relevance.argmax())
+        selected = [first]
+        available = np.ones(len(vectors), dtype=bool)
+        available[first] = False
+
+        # Highest similarity of each candidate to anything already selected
+        redundancy = pairwise[first].copy()
+
+        while len(selected) < min(k, len(vectors)):
+            scores = relevance - (1.0 - mmr_lambda) * redundancy
+            scores[~available] = -np.inf
+            pick = int(scores.argmax())
+
+            selected.append(pick)
+            available[pick] = False
+            np.maximum(redundancy, pairwise[pick], out=redundancy)
+
+        return selected
+
+    @staticmethod
+    def _format_results(results: Dict[str, Any], q: int) -> List[Dict[str, Any]]:
+        """Format the ChromaDB hits for the q-th query of a query response."""
+        return [
+            {
+                "id": doc_id,
+                "text": text,
+                "metadata": metadata,
+                "score": 1.0 - distance,  # Convert distance to similarity
+                "distance": distance
+            }
+            for doc_id, text, metadata, distance in zip(
+                results["ids"][q],
+                results["documents"][q],
+                results["metadatas"][q],
+                results["distances"][q]
+            )
+        ]
+
     def get_collection_stats(self) -> Dict[str, Any]:
         """Get statistics about the collection.
 
@@ -148,6 +452,6 @@ class ChromaDBStore:
         self.client.delete_collection(name=self.collection_name)
         self.collection = self.client.get_or_create_collection(
             name=self.collection_name,
-            metadata={"description": "Bitext customer support Q&A pairs"}
+            metadata=COLLECTION_METADATA
         )
         logger.info("Collection reset complete")
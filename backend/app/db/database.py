@@ -1,9 +1,23 @@
 """Database connection and session management."""
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base
+import logging
+import re
+
+from sqlalchemy import DefaultClause, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncConnection, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import DeclarativeBase
 
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
+# Casts in a deparsed column default, e.g. 'UTC'::text or ::character varying
+_DEFAULT_CAST_RE = re.compile(r"::\w+(?: \w+)*")
+
+# Indexes that were removed from the models; dropped on startup so
+# databases that already built them stop maintaining them on every insert
+RETIRED_INDEXES = ("ix_queries_sweep", "ix_queries_filters")
+
 # Convert postgresql:// to postgresql+asyncpg:// for async support
 database_url = settings.database_url.replace("postgresql://", "postgresql+asyncpg://")
 
@@ -12,6 +26,15 @@ engine = create_async_engine(
     database_url,
     echo=settings.log_level == "DEBUG",
     future=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=True,  # Drop connections closed by Postgres idle timeouts
+    connect_args={
+        # Queries here are short OLTP lookups; JIT compilation only adds planning time
+        "server_settings": {"jit": "off"},
+    },
 )
 
 # Create async session factory
@@ -19,14 +42,113 @@ AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False,
+    autoflush=False,
 )
 
-# Create declarative base
-Base = declarative_base()
+
+class Base(DeclarativeBase):
+    """Declarative base for all ORM models."""
+
+    # Fetch server-generated defaults (timestamps) with RETURNING on insert,
+    # so they are loaded without a lazy refresh, which async sessions can't do
+    __mapper_args__ = {"eager_defaults": True}
+
+
+def _normalize_default(expr: str) -> str:
+    """Drop the type casts and whitespace Postgres adds when it deparses a default."""
+    return "".join(_DEFAULT_CAST_RE.sub("", expr).split())
+
+
+async def sync_server_defaults(conn: AsyncConnection) -> None:
+    """Apply model server defaults to tables that already exist.
+
+    create_all only creates missing tables, so a server_default added to a
+    model would never reach a persisted database and inserts relying on it
+    would fail. Current defaults are read from information_schema first and
+    only columns whose default differs are altered: each ALTER takes an
+    ACCESS EXCLUSIVE lock, so once the defaults are in place startup runs
+    no DDL at all.
+
+    Args:
+        conn: Connection inside the startup transaction
+    """
+    result = await conn.execute(text(
+        "SELECT table_name, column_name, column_default "
+        "FROM information_schema.columns WHERE table_schema = current_schema()"
+    ))
+    current = {(row.table_name, row.column_name): row.column_default for row in result}
+
+    preparer = conn.dialect.identifier_preparer
+    ddl_compiler = conn.dialect.ddl_compiler(conn.dialect, None)
+
+    for table in Base.metadata.sorted_tables:
+        for column in table.columns:
+            if not isinstance(column.server_default, DefaultClause):
+                continue
+
+            key = (table.name, column.name)
+            if key not in current:
+                # Column missing entirely; not something SET DEFAULT can fix
+                continue
+
+            # Rendered the same way CREATE TABLE renders it
+            default = ddl_compiler.get_column_default_string(column)
+            existing = current[key]
+            if existing is not None and _normalize_default(existing) == _normalize_default(default):
+                continue
+
+            await conn.execute(text(
+                f"ALTER TABLE {preparer.format_table(table)} "
+                f"ALTER COLUMN {preparer.format_column(column)} SET DEFAULT {default}"
+            ))
+
+
+async def sync_indexes(conn: AsyncConnection) -> None:
+    """Create model indexes that are missing from tables that already exist.
+
+    create_all skips existing tables entirely, indexes included, so an
+    index added to a model would never reach a persisted database. Each
+    index is checked by name first, so this is a no-op once it exists.
+    Indexes listed in RETIRED_INDEXES are dropped if present.
+
+    An index that cannot be built is logged and skipped. For example, the
+    GIN index on a column still stored as json rather than jsonb. The
+    savepoint keeps the failure from aborting the startup transaction.
+
+    Args:
+        conn: Connection inside the startup transaction
+    """
+    preparer = conn.dialect.identifier_preparer
+    for name in RETIRED_INDEXES:
+        await conn.execute(text(f"DROP INDEX IF EXISTS {preparer.quote(name)}"))
+
+    for table in Base.metadata.sorted_tables:
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            try:
+                async with conn.begin_nested():
+                    await conn.run_sync(index.create, checkfirst=True)
+            except DBAPIError as e:
+                logger.warning(f"Could not create index {index.name} on {table.name}: {e}")
 
 
 async def get_db() -> AsyncSession:
-    """Dependency to get database session."""
+    """Dependency to get a database session for read endpoints.
+
+    Nothing is committed; the transaction is rolled back when the session
+    closes.
+    """
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+
+async def get_db_write() -> AsyncSession:
+    """Dependency to get a database session that commits after the request."""
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -1,28 +1,36 @@
 """SQLAlchemy database models for RAGLens."""
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
-from sqlalchemy import Column, String, DateTime, Float, Integer, Text, ForeignKey, JSON
-from sqlalchemy.dialects.postgresql import UUID, ARRAY
-from sqlalchemy.orm import relationship
+from sqlalchemy import String, DateTime, Float, Integer, Text, ForeignKey, Index, func
+from sqlalchemy.dialects.postgresql import UUID, ARRAY, JSONB
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.database import Base
 
+# Timestamps are filled in by Postgres as part of the INSERT. Columns are
+# naive DateTime holding UTC, so convert now() explicitly rather than
+# relying on the server's TimeZone setting.
+UTC_NOW = func.timezone("UTC", func.now())
+
 
 class Query(Base):
     """User query model."""
     __tablename__ = "queries"
+    __table_args__ = (
+        Index("ix_queries_timestamp", "timestamp"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    query_text = Column(Text, nullable=False)
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
-    llm_provider = Column(String(50), nullable=False)  # claude or openai
-    retrieval_config = Column(JSON, nullable=True)  # Store retrieval params
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    query_text: Mapped[str] = mapped_column(Text, nullable=False)
+    timestamp: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW, nullable=False)
+    llm_provider: Mapped[str] = mapped_column(String(50), nullable=False)  # claude or openai
+    retrieval_config: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, nullable=True)  # Store retrieval params
 
     # Relationships
-    responses = relationship("Response", back_populates="query", cascade="all, delete-orphan")
-    evaluations = relationship("Evaluation", back_populates="query", cascade="all, delete-orphan")
+    responses: Mapped[List["Response"]] = relationship(back_populates="query", cascade="all, delete-orphan")
+    evaluations: Mapped[List["Evaluation"]] = relationship(back_populates="query", cascade="all, delete-orphan")
 
     def __repr__(self):
         return f"<Query(id={self.id}, query_text='{self.query_text[:50]}...')>"
@@ -31,18 +39,21 @@ class Query(Base):
 class Response(Base):
     """LLM response model."""
     __tablename__ = "responses"
-
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    query_id = Column(UUID(as_uuid=True), ForeignKey("queries.id"), nullable=False)
-    response_text = Column(Text, nullable=False)
-    sources_json = Column(JSON, nullable=False)  # List of retrieved chunks with scores
-    latency_ms = Column(Float, nullable=False)
-    token_usage = Column(JSON, nullable=False)  # {prompt_tokens, completion_tokens, total_tokens}
-    cost = Column(Float, nullable=False)
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
+    __table_args__ = (
+        Index("ix_responses_query_id_ts", "query_id", "timestamp"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    query_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("queries.id"), nullable=False)
+    response_text: Mapped[str] = mapped_column(Text, nullable=False)
+    sources_json: Mapped[List[Dict[str, Any]]] = mapped_column(JSONB, nullable=False)  # List of retrieved chunks with scores
+    latency_ms: Mapped[float] = mapped_column(Float, nullable=False)
+    token_usage: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False)  # {prompt_tokens, completion_tokens, total_tokens}
+    cost: Mapped[float] = mapped_column(Float, nullable=False)
+    timestamp: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW, nullable=False)
 
     # Relationships
-    query = relationship("Query", back_populates="responses")
+    query: Mapped["Query"] = relationship(back_populates="responses")
 
     def __repr__(self):
         return f"<Response(id={self.id}, query_id={self.query_id})>"
@@ -51,17 +62,25 @@ class Response(Base):
 class Evaluation(Base):
     """Evaluation results model."""
     __tablename__ = "evaluations"
-
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    query_id = Column(UUID(as_uuid=True), ForeignKey("queries.id"), nullable=False)
-    evaluation_type = Column(String(50), nullable=False)  # retrieval, generation, combined
-    scores_json = Column(JSON, nullable=False)  # Dictionary of metric scores
-    evaluator = Column(String(100), nullable=False)  # Which LLM evaluated
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
-    eval_metadata = Column(JSON, nullable=True)  # Additional evaluation metadata
+    __table_args__ = (
+        # Per-query history, newest first
+        Index("ix_evaluations_query_id_ts", "query_id", "timestamp"),
+        # List filtered by type, newest first
+        Index("ix_evaluations_type_ts", "evaluation_type", "timestamp"),
+        # Unfiltered list and diagnosis date-range scans
+        Index("ix_evaluations_timestamp", "timestamp"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    query_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("queries.id"), nullable=False)
+    evaluation_type: Mapped[str] = mapped_column(String(50), nullable=False)  # retrieval, generation, combined
+    scores_json: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False)  # Dictionary of metric scores
+    evaluator: Mapped[str] = mapped_column(String(100), nullable=False)  # Which LLM evaluated
+    timestamp: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW, nullable=False)
+    eval_metadata: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, nullable=True)  # Additional evaluation metadata
 
     # Relationships
-    query = relationship("Query", back_populates="evaluations")
+    query: Mapped["Query"] = relationship(back_populates="evaluations")
 
     def __repr__(self):
         return f"<Evaluation(id={self.id}, type={self.evaluation_type})>"
@@ -71,16 +90,16 @@ class GoldenTestSet(Base):
     """Golden test set model."""
     __tablename__ = "golden_test_sets"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    name = Column(String(200), nullable=False, unique=True)
-    description = Column(Text, nullable=True)
-    version = Column(Integer, default=1, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    name: Mapped[str] = mapped_column(String(200), nullable=False, unique=True)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    version: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW, nullable=False)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=UTC_NOW, onupdate=datetime.utcnow)
 
     # Relationships
-    test_cases = relationship("GoldenTestCase", back_populates="test_set", cascade="all, delete-orphan")
-    evaluation_runs = relationship("EvaluationRun", back_populates="test_set", cascade="all, delete-orphan")
+    test_cases: Mapped[List["GoldenTestCase"]] = relationship(back_populates="test_set", cascade="all, delete-orphan")
+    evaluation_runs: Mapped[List["EvaluationRun"]] = relationship(back_populates="test_set", cascade="all, delete-orphan")
 
     def __repr__(self):
         return f"<GoldenTestSet(id={self.id}, name='{self.name}')>"
@@ -89,19 +108,22 @@ class GoldenTestSet(Base):
 class GoldenTestCase(Base):
     """Individual test case in a golden set."""
     __tablename__ = "golden_test_cases"
-
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    test_set_id = Column(UUID(as_uuid=True), ForeignKey("golden_test_sets.id"), nullable=False)
-    query = Column(Text, nullable=False)
-    expected_answer = Column(Text, nullable=False)
-    relevant_doc_ids = Column(ARRAY(String), nullable=True)  # List of relevant chunk IDs
-    category = Column(String(100), nullable=True)
-    intent = Column(String(100), nullable=True)
-    case_metadata = Column(JSON, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    __table_args__ = (
+        Index("ix_golden_test_cases_set_created", "test_set_id", "created_at"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    test_set_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("golden_test_sets.id"), nullable=False)
+    query: Mapped[str] = mapped_column(Text, nullable=False)
+    expected_answer: Mapped[str] = mapped_column(Text, nullable=False)
+    relevant_doc_ids: Mapped[Optional[List[str]]] = mapped_column(ARRAY(String), nullable=True)  # List of relevant chunk IDs
+    category: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    intent: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    case_metadata: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW, nullable=False)
 
     # Relationships
-    test_set = relationship("GoldenTestSet", back_populates="test_cases")
+    test_set: Mapped["GoldenTestSet"] = relationship(back_populates="test_cases")
 
     def __repr__(self):
         return f"<GoldenTestCase(id={self.id}, category='{self.category}')>"
@@ -110,18 +132,21 @@ class GoldenTestCase(Base):
 class EvaluationRun(Base):
     """Batch evaluation run model."""
     __tablename__ = "evaluation_runs"
-
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    test_set_id = Column(UUID(as_uuid=True), ForeignKey("golden_test_sets.id"), nullable=False)
-    config_snapshot = Column(JSON, nullable=False)  # Store config used for this run
-    status = Column(String(50), default="pending", nullable=False)  # pending, running, completed, failed
-    results_json = Column(JSON, nullable=True)  # Aggregated results
-    started_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    completed_at = Column(DateTime, nullable=True)
+    __table_args__ = (
+        Index("ix_evaluation_runs_set_started", "test_set_id", "started_at"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    test_set_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("golden_test_sets.id"), nullable=False)
+    config_snapshot: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False)  # Store config used for this run
+    status: Mapped[str] = mapped_column(String(50), default="pending", nullable=False)  # pending, running, completed, failed
+    results_json: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, nullable=True)  # Aggregated results
+    started_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW, nullable=False)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Relationships
-    test_set = relationship("GoldenTestSet", back_populates="evaluation_runs")
-    metrics = relationship("Metric", back_populates="run", cascade="all, delete-orphan")
+    test_set: Mapped["GoldenTestSet"] = relationship(back_populates="evaluation_runs")
+    metrics: Mapped[List["Metric"]] = relationship(back_populates="run", cascade="all, delete-orphan")
 
     def __repr__(self):
         return f"<EvaluationRun(id={self.id}, status='{self.status}')>"
@@ -130,17 +155,26 @@ class EvaluationRun(Base):
 class Metric(Base):
     """Metrics model for time-series tracking."""
     __tablename__ = "metrics"
-
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    run_id = Column(UUID(as_uuid=True), ForeignKey("evaluation_runs.id"), nullable=True)
-    query_id = Column(UUID(as_uuid=True), ForeignKey("queries.id"), nullable=True)
-    metric_type = Column(String(100), nullable=False)  # latency, cost, retrieval_score, generation_score
-    value = Column(Float, nullable=False)
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
-    tags = Column(JSON, nullable=True)  # Additional metadata for filtering
+    __table_args__ = (
+        # Time series per metric type; value is included so dashboard
+        # aggregates can be answered with index-only scans
+        Index("ix_metrics_type_ts", "metric_type", "timestamp", postgresql_include=["value"]),
+        Index("ix_metrics_run_id", "run_id"),
+        Index("ix_metrics_query_id", "query_id"),
+        # Containment filters on tags (tags @> '{...}')
+        Index("ix_metrics_tags_gin", "tags", postgresql_using="gin"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    run_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("evaluation_runs.id"), nullable=True)
+    query_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("queries.id"), nullable=True)
+    metric_type: Mapped[str] = mapped_column(String(100), nullable=False)  # latency, cost, retrieval_score, generation_score
+    value: Mapped[float] = mapped_column(Float, nullable=False)
+    timestamp: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW, nullable=False)
+    tags: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, nullable=True)  # Additional metadata for filtering
 
     # Relationships
-    run = relationship("EvaluationRun", back_populates="metrics")
+    run: Mapped[Optional["EvaluationRun"]] = relationship(back_populates="metrics")
 
     def __repr__(self):
         return f"<Metric(id={self.id}, type='{self.metric_type}', value={self.value})>"
@@ -7,7 +7,7 @@ from app.evaluation.diagnosis.agent import (
     IssueSeverity,
     IssueCategory,
     ActionType,
-    report_to_dict
+    report_to_json
 )
 
 __all__ = [
@@ -18,5 +18,5 @@ __all__ = [
     "IssueSeverity",
     "IssueCategory",
     "ActionType",
-    "report_to_dict"
+    "report_to_json"
 ]
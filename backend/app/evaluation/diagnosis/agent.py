@@ -5,23 +5,49 @@ This agent:
 2. Suggests actionable fixes (retrieval params, prompts, etc.)
 3. Tracks which suggestions are safe to auto-apply vs need approval
 """
+import asyncio
 import logging
-import json
+import time
+import orjson
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass
 from enum import Enum
-from collections import defaultdict
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, case, cast, Float
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
-from anthropic import AsyncAnthropic
 
+from app.db.database import AsyncSessionLocal
 from app.db.models import Evaluation, Query
+from app.core.generation.output_parsing import strip_code_fence
 from app.config import settings
+from app.core.clients import get_anthropic_client
 
 logger = logging.getLogger(__name__)
 
+# Overall score of an evaluation, falling back to the mean of the nested
+# generation scores when no overall score was recorded. The column is cast
+# to jsonb because databases created before it became JSONB still store
+# it as json, which the jsonb_* functions reject.
+_scores_jsonb = cast(Evaluation.scores_json, JSONB)
+_generation_values = func.jsonb_each_text(
+    _scores_jsonb["generation"]
+).table_valued("key", "value")
+SCORE_EXPR = func.coalesce(
+    cast(_scores_jsonb["overall_score"].astext, Float),
+    case((
+        func.jsonb_typeof(_scores_jsonb["generation"]) == "object",
+        select(func.avg(cast(_generation_values.c.value, Float))).scalar_subquery()
+    ))
+)
+
+LOW_SCORE_THRESHOLD = 0.7
+
+# Dashboards poll the quick summary; reuse it per window size for a short
+# TTL instead of re-aggregating on every request
+_summary_cache: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+
 
 class IssueSeverity(str, Enum):
     """Severity levels for identified issues."""
@@ -128,7 +154,7 @@ class DiagnosisAgent:
 
     def __init__(self, db: AsyncSession):
         self.db = db
-        self.client = AsyncAnthropic(api_key=settings.anthropic_api_key)
+        self.client = get_anthropic_client()
 
     async def generate_report(
         self,
@@ -162,8 +188,17 @@ class DiagnosisAgent:
                 summary=f"Insufficient data: Only {metrics['total_evaluations']} evaluations found. Need at least {min_evaluations}."
             )
 
-        # Analyze with LLM
-        analysis = await self._analyze_with_llm(metrics, period_start, period_end)
+        # Healthy periods need no LLM analysis: the same rules that drive
+        # dashboard alerts already explain the data
+        avg_score = metrics.get("avg_score")
+        if avg_score is not None and not self._detect_alerts(metrics):
+            analysis = {
+                "issues": [],
+                "summary": f"System healthy: average score {avg_score:.0%} with no low-scoring categories."
+            }
+        else:
+            # Analyze with LLM
+            analysis = await self._analyze_with_llm(metrics, period_start, period_end)
 
         # Convert to issues and actions
         issues = self._create_issues(analysis, metrics)
@@ -185,105 +220,116 @@ class DiagnosisAgent:
         start_date: datetime,
         end_date: datetime
     ) -> Dict[str, Any]:
-        """Gather evaluation metrics for analysis."""
+        """Gather evaluation metrics for analysis.
+
+        Scores, groupings and buckets are aggregated in Postgres so only
+        summary rows are transferred, not every evaluation in the period.
+        """
         # Base filter
         date_filter = and_(
             Evaluation.timestamp >= start_date,
             Evaluation.timestamp <= end_date
         )
 
-        # Total count
-        total = await self.db.scalar(
-            select(func.count(Evaluation.id)).where(date_filter)
-        )
-
-        # Get all evaluations with their queries
-        stmt = (
-            select(Evaluation, Query)
+        # One row per evaluation with its score and query filters
+        scored = (
+            select(
+                Query.query_text,
+                func.coalesce(Query.retrieval_config["filter_category"].astext, "unknown").label("category"),
+                func.coalesce(Query.retrieval_config["filter_intent"].astext, "unknown").label("intent"),
+                SCORE_EXPR.label("score")
+            )
+            .select_from(Evaluation)
             .join(Query, Evaluation.query_id == Query.id)
             .where(date_filter)
+            .subquery()
+        )
+        score = scored.c.score
+
+        overview_stmt = (
+            # Totals and distribution buckets in a single pass
+            select(
+                func.count(),
+                func.avg(score),
+                func.count().filter(score < 0.25),
+                func.count().filter(and_(score >= 0.25, score < 0.5)),
+                func.count().filter(and_(score >= 0.5, score < 0.75)),
+                func.count().filter(score >= 0.75)
+            ).select_from(scored)
+        )
+        low_scoring_stmt = (
+            # Lowest-scoring queries first
+            select(scored.c.query_text, score, scored.c.category, scored.c.intent)
+            .where(score < LOW_SCORE_THRESHOLD)
+            .order_by(score)
+            .limit(10)
         )
-        result = await self.db.execute(stmt)
-        rows = result.all()
 
-        if not rows:
+        # Independent scans of the same window; run them side by side
+        overview, category_breakdown, intent_breakdown, low_rows = await asyncio.gather(
+            self._fetch_all(overview_stmt),
+            self._score_breakdown(scored, scored.c.category),
+            self._score_breakdown(scored, scored.c.intent),
+            self._fetch_all(low_scoring_stmt)
+        )
+        total, avg_score, *buckets = overview[0]
+
+        if not total:
             return {"total_evaluations": 0}
 
-        # Process evaluations
-        scores = []
-        category_scores = defaultdict(list)
-        intent_scores = defaultdict(list)
-        low_scoring = []
-        score_buckets = {"0-25%": 0, "25-50%": 0, "50-75%": 0, "75-100%": 0}
-
-        for eval_obj, query_obj in rows:
-            score = None
-            if eval_obj.scores_json:
-                score = eval_obj.scores_json.get("overall_score")
-                if score is None and "generation" in eval_obj.scores_json:
-                    # Try to get from nested structure
-                    gen_scores = eval_obj.scores_json.get("generation", {})
-                    if gen_scores:
-                        score = sum(gen_scores.values()) / len(gen_scores)
-
-            if score is not None:
-                scores.append(score)
-
-                # Get category/intent from query config
-                config = query_obj.retrieval_config or {}
-                category = config.get("filter_category", "unknown")
-                intent = config.get("filter_intent", "unknown")
-
-                category_scores[category].append(score)
-                intent_scores[intent].append(score)
-
-                # Bucket distribution
-                if score < 0.25:
-                    score_buckets["0-25%"] += 1
-                elif score < 0.5:
-                    score_buckets["25-50%"] += 1
-                elif score < 0.75:
-                    score_buckets["50-75%"] += 1
-                else:
-                    score_buckets["75-100%"] += 1
-
-                # Track low-scoring
-                if score < 0.7:
-                    low_scoring.append({
-                        "query": query_obj.query_text[:100],
-                        "score": score,
-                        "category": category,
-                        "intent": intent
-                    })
-
-        avg_score = sum(scores) / len(scores) if scores else None
-
-        # Calculate category averages
-        category_breakdown = {
-            cat: {
-                "avg": sum(s) / len(s),
-                "count": len(s)
-            }
-            for cat, s in category_scores.items()
-        }
+        score_buckets = dict(zip(["0-25%", "25-50%", "50-75%", "75-100%"], buckets))
 
-        intent_breakdown = {
-            intent: {
-                "avg": sum(s) / len(s),
-                "count": len(s)
+        low_scoring = [
+            {
+                "query": query_text[:100],
+                "score": row_score,
+                "category": category,
+                "intent": intent
             }
-            for intent, s in intent_scores.items()
-        }
+            for query_text, row_score, category, intent in low_rows
+        ]
 
         return {
             "total_evaluations": total,
             "avg_score": avg_score,
             "category_breakdown": category_breakdown,
             "intent_breakdown": intent_breakdown,
-            "low_scoring_queries": low_scoring[:10],  # Top 10
+            "low_scoring_queries": low_scoring,
             "score_distribution": score_buckets
         }
 
+    async def _fetch_all(self, stmt) -> List[Any]:
+        """Run a read-only statement on its own pooled session.
+
+        An AsyncSession cannot run statements concurrently, so each
+        metrics query gets a separate connection.
+        """
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(stmt)
+            return result.all()
+
+    async def _score_breakdown(self, scored, key) -> Dict[str, Dict[str, Any]]:
+        """Average score and count per value of key, most frequent first.
+
+        Args:
+            scored: Subquery of scored evaluations
+            key: Column of scored to group by
+
+        Returns:
+            Mapping of key value to {"avg", "count"}
+        """
+        count = func.count(scored.c.score)
+        rows = await self._fetch_all(
+            select(key, func.avg(scored.c.score), count)
+            .where(scored.c.score.is_not(None))
+            .group_by(key)
+            .order_by(count.desc())
+        )
+        return {
+            value: {"avg": avg, "count": n}
+            for value, avg, n in rows
+        }
+
     async def _analyze_with_llm(
         self,
         metrics: Dict[str, Any],
@@ -324,24 +370,25 @@ class DiagnosisAgent:
         )
 
         try:
-            response = await self.client.messages.create(
+            chunks = []
+            async with self.client.messages.stream(
                 model="claude-3-haiku-20240307",  # Fast, cheap for analysis
                 max_tokens=1000,
                 temperature=0.0,
                 messages=[{"role": "user", "content": prompt}]
-            )
-
-            result_text = response.content[0].text
+            ) as stream:
+                async for text in stream.text_stream:
+                    chunks.append(text)
+                    # Stop as soon as the JSON object is complete instead of
+                    # waiting for a closing fence or trailing commentary
+                    if text.rstrip().endswith("}"):
+                        try:
+                            return orjson.loads(strip_code_fence("".join(chunks)))
+                        except orjson.JSONDecodeError:
+                            pass
 
             # Parse JSON
-            if result_text.startswith("```json"):
-                result_text = result_text[7:]
-            if result_text.startswith("```"):
-                result_text = result_text[3:]
-            if result_text.endswith("```"):
-                result_text = result_text[:-3]
-
-            return json.loads(result_text.strip())
+            return orjson.loads(strip_code_fence("".join(chunks)))
 
         except Exception as e:
             logger.error(f"LLM analysis failed: {e}")
@@ -439,17 +486,8 @@ class DiagnosisAgent:
 
         return actions
 
-    async def get_quick_summary(self, days: int = 7) -> Dict[str, Any]:
-        """Get a quick summary without full LLM analysis.
-
-        Useful for dashboards and monitoring.
-        """
-        period_end = datetime.utcnow()
-        period_start = period_end - timedelta(days=days)
-
-        metrics = await self._gather_metrics(period_start, period_end)
-
-        # Identify obvious issues without LLM
+    def _detect_alerts(self, metrics: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Rule-based alerts for low overall and per-category scores."""
         alerts = []
 
         avg_score = metrics.get("avg_score")
@@ -469,7 +507,28 @@ class DiagnosisAgent:
                     "message": f"Category '{cat}' has low avg score: {data['avg']:.0%}"
                 })
 
-        return {
+        return alerts
+
+    async def get_quick_summary(self, days: int = 7) -> Dict[str, Any]:
+        """Get a quick summary without full LLM analysis.
+
+        Useful for dashboards and monitoring. Results are cached per
+        window size for settings.diagnosis_summary_ttl seconds.
+        """
+        cached = _summary_cache.get(days)
+        if cached and time.monotonic() - cached[0] < settings.diagnosis_summary_ttl:
+            return cached[1]
+
+        period_end = datetime.utcnow()
+        period_start = period_end - timedelta(days=days)
+
+        metrics = await self._gather_metrics(period_start, period_end)
+
+        # Identify obvious issues without LLM
+        alerts = self._detect_alerts(metrics)
+        avg_score = metrics.get("avg_score")
+
+        summary = {
             "period": {
                 "start": period_start.isoformat(),
                 "end": period_end.isoformat()
@@ -480,17 +539,14 @@ class DiagnosisAgent:
             "alerts": alerts,
             "low_scoring_count": len(metrics.get("low_scoring_queries", []))
         }
+        _summary_cache[days] = (time.monotonic(), summary)
+        return summary
+
 
+def report_to_json(report: DiagnosisReport) -> bytes:
+    """Serialize a DiagnosisReport to JSON.
 
-def report_to_dict(report: DiagnosisReport) -> Dict[str, Any]:
-    """Convert DiagnosisReport to dictionary for JSON serialization."""
-    return {
-        "generated_at": report.generated_at.isoformat(),
-        "period_start": report.period_start.isoformat(),
-        "period_end": report.period_end.isoformat(),
-        "total_evaluations": report.total_evaluations,
-        "avg_score": report.avg_score,
-        "issues": [asdict(i) for i in report.issues],
-        "actions": [asdict(a) for a in report.actions],
-        "summary": report.summary
-    }
+    orjson encodes the dataclasses, enums and datetimes directly, without
+    building an intermediate dict tree.
+    """
+    return orjson.dumps(report)
@@ -4,9 +4,13 @@ RAGAS expects a specific data format for evaluation. This module handles
 the conversion from our internal formats.
 """
 import re
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 
-from ragas import EvaluationDataset, SingleTurnSample
+if TYPE_CHECKING:
+    from ragas import EvaluationDataset, SingleTurnSample
+
+# Leading 'Q: <question>\nA: ' of a Q&A chunk
+_QA_PREFIX_RE = re.compile(r"^Q:\s*.*?\nA:\s*", flags=re.DOTALL)
 
 
 def _strip_qa_prefix(text: str) -> str:
@@ -17,8 +21,7 @@ def _strip_qa_prefix(text: str) -> str:
     so we strip it to avoid confusing the LLM judge (especially for
     context precision, which compares each context against the response).
     """
-    stripped = re.sub(r"^Q:\s*.*?\nA:\s*", "", text, count=1, flags=re.DOTALL)
-    return stripped if stripped != text else text
+    return _QA_PREFIX_RE.sub("", text, count=1)
 
 
 def convert_contexts_from_sources(sources_json: List[Dict[str, Any]]) -> List[str]:
@@ -36,7 +39,7 @@ def convert_contexts_from_sources(sources_json: List[Dict[str, Any]]) -> List[st
     Returns:
         List of context text strings
     """
-    return [_strip_qa_prefix(src.get("text", "")) for src in sources_json if src.get("text")]
+    return [_strip_qa_prefix(text) for src in sources_json if (text := src.get("text"))]
 
 
 def convert_to_ragas_sample(
@@ -44,7 +47,7 @@ def convert_to_ragas_sample(
     response: str,
     contexts: List[Dict[str, Any]],
     ground_truth: Optional[str] = None,
-) -> SingleTurnSample:
+) -> "SingleTurnSample":
     """Convert single evaluation data to RAGAS SingleTurnSample.
 
     Args:
@@ -59,21 +62,19 @@ def convert_to_ragas_sample(
     # Extract context texts from our sources format
     context_texts = convert_contexts_from_sources(contexts)
 
-    sample = SingleTurnSample(
+    from ragas import SingleTurnSample
+
+    return SingleTurnSample(
         user_input=query,
         response=response,
         retrieved_contexts=context_texts,
+        reference=ground_truth or None,
     )
 
-    if ground_truth:
-        sample.reference = ground_truth
-
-    return sample
-
 
 def create_ragas_dataset(
     samples: List[Dict[str, Any]],
-) -> EvaluationDataset:
+) -> "EvaluationDataset":
     """Create RAGAS EvaluationDataset from list of sample dicts.
 
     Args:
@@ -86,15 +87,14 @@ def create_ragas_dataset(
     Returns:
         RAGAS EvaluationDataset
     """
-    ragas_samples = []
+    from ragas import EvaluationDataset
 
-    for s in samples:
-        sample = convert_to_ragas_sample(
+    return EvaluationDataset(samples=[
+        convert_to_ragas_sample(
             query=s["query"],
             response=s["response"],
             contexts=s.get("contexts", []),
             ground_truth=s.get("expected_answer"),
         )
-        ragas_samples.append(sample)
-
-    return EvaluationDataset(samples=ragas_samples)
+        for s in samples
+    ])
@@ -3,15 +3,18 @@
 Provides a unified interface for evaluating RAG responses using RAGAS metrics.
 """
 import asyncio
+import functools
+import hashlib
 import logging
 import math
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 
 import numpy as np
+import orjson
 
-from ragas import evaluate, EvaluationDataset
-from ragas.run_config import RunConfig
-
+from app.config import settings
 from .llm_providers import get_ragas_llm, get_ragas_embeddings
 from .metrics import (
     get_metrics_for_evaluation,
@@ -23,11 +26,36 @@ from .data_adapter import convert_to_ragas_sample, create_ragas_dataset
 
 logger = logging.getLogger(__name__)
 
+# Sample input columns in a RAGAS result; every other column is a metric
+_INPUT_COLUMNS = frozenset({"user_input", "response", "retrieved_contexts", "reference"})
+
+# LRU of successful single-sample results keyed on a digest of the judge
+# and the sample. Module level because an evaluator is built per request;
+# re-evaluating the same stored response skips every judge call.
+_result_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
 
-def _run_ragas_evaluate(**kwargs):
-    """Run RAGAS evaluate with standard asyncio policy to avoid uvloop conflicts."""
+
+def _init_ragas_worker():
+    """Use the standard asyncio policy in RAGAS threads to avoid uvloop conflicts."""
     asyncio.set_event_loop_policy(asyncio.DefaultEventLoopPolicy())
-    return evaluate(**kwargs)
+
+
+# Dedicated pool for RAGAS runs, kept off the default executor. Each run
+# already issues up to RunConfig.max_workers judge calls, so the bound
+# also caps total concurrent LLM requests.
+_ragas_pool = ThreadPoolExecutor(
+    max_workers=settings.ragas_max_workers,
+    thread_name_prefix="ragas",
+    initializer=_init_ragas_worker
+)
+
+
+async def _run_ragas_evaluate(**kwargs):
+    """Run RAGAS evaluate on the dedicated pool."""
+    from ragas import evaluate
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_ragas_pool, functools.partial(evaluate, **kwargs))
 
 
 class RAGASEvaluator:
@@ -58,6 +86,9 @@ class RAGASEvaluator:
             model: Optional model override
             metric_config: Optional custom metric weights
         """
+        # Deferred with the rest of RAGAS; see llm_providers
+        from ragas.run_config import RunConfig
+
         self.provider = provider
         self.model = model
         self.llm = get_ragas_llm(provider, model)
@@ -91,8 +122,16 @@ class RAGASEvaluator:
         Returns:
             Evaluation results with scores and overall_score
         """
+        from ragas import EvaluationDataset
+
         has_ground_truth = expected_answer is not None
 
+        cache_key = self._cache_key(query, response, contexts, expected_answer)
+        cached = _result_cache.get(cache_key)
+        if cached is not None:
+            _result_cache.move_to_end(cache_key)
+            return cached
+
         # Convert to RAGAS format
         sample = convert_to_ragas_sample(
             query=query,
@@ -107,8 +146,7 @@ class RAGASEvaluator:
         try:
             # Run RAGAS evaluation in a separate thread to avoid
             # nested event loop conflicts with uvloop
-            result = await asyncio.to_thread(
-                _run_ragas_evaluate,
+            result = await _run_ragas_evaluate(
                 dataset=EvaluationDataset(samples=[sample]),
                 metrics=metrics,
                 llm=self.llm,
@@ -122,7 +160,7 @@ class RAGASEvaluator:
                 scores, has_ground_truth, self.metric_config
             )
 
-            return {
+            evaluation = {
                 "scores": {
                     **scores,
                     "overall_score": overall,
@@ -134,6 +172,12 @@ class RAGASEvaluator:
                 "metrics_used": [m.__class__.__name__ for m in metrics],
             }
 
+            _result_cache[cache_key] = evaluation
+            while len(_result_cache) > settings.evaluation_cache_size:
+                _result_cache.popitem(last=False)
+
+            return evaluation
+
         except Exception as e:
             logger.error(f"RAGAS evaluation failed: {e}", exc_info=True)
             return {
@@ -144,6 +188,29 @@ class RAGASEvaluator:
                 "overall_score": None,
             }
 
+    def _cache_key(
+        self,
+        query: str,
+        response: str,
+        contexts: List[Dict[str, Any]],
+        expected_answer: Optional[str],
+    ) -> str:
+        """Digest of everything that determines an evaluation result.
+
+        Only exact matches are reused: a near-identical response can be
+        judged differently, so no similarity threshold is applied.
+        """
+        payload = orjson.dumps([
+            self.provider,
+            self.model,
+            self.metric_config,
+            query,
+            response,
+            [c.get("text") for c in contexts],
+            expected_answer,
+        ])
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
     async def evaluate_batch(
         self,
         samples: List[Dict[str, Any]],
@@ -185,8 +252,7 @@ class RAGASEvaluator:
         try:
             # Run RAGAS evaluation on full batch in a separate thread
             # to avoid nested event loop conflicts with uvloop
-            result = await asyncio.to_thread(
-                _run_ragas_evaluate,
+            result = await _run_ragas_evaluate(
                 dataset=dataset,
                 metrics=metrics,
                 llm=self.llm,
@@ -194,20 +260,23 @@ class RAGASEvaluator:
                 run_config=self.run_config,
             )
 
+            # Read the per-sample table once, not once per sample
+            rows, metric_cols = self._score_table(result)
+
             # Log raw RAGAS output for diagnostics
-            if hasattr(result, "to_pandas"):
-                df = result.to_pandas()
-                metric_cols = [c for c in df.columns if c not in ("user_input", "response", "retrieved_contexts", "reference")]
+            if metric_cols:
                 logger.info(
                     "RAGAS batch raw scores (metrics=%s): %s",
                     [m.__class__.__name__ for m in metrics],
-                    {col: df[col].tolist() for col in metric_cols},
+                    {col: [row.get(col) for row in rows] for col in metric_cols},
                 )
 
             # Process results for each sample
             results = []
             for i, sample in enumerate(samples):
-                scores = self._extract_scores_for_index(result, i)
+                scores = self._sanitize_scores({
+                    normalized: rows[i].get(col) for col, normalized in metric_cols.items()
+                }) if i < len(rows) else {}
                 has_gt = has_ground_truth_list[i]
                 overall = compute_overall_score(scores, has_gt, self.metric_config)
 
@@ -247,54 +316,39 @@ class RAGASEvaluator:
         Returns:
             Dict of normalized metric names to scores
         """
-        scores = {}
+        rows, metric_cols = self._score_table(result)
 
-        # RAGAS returns a pandas DataFrame-like result
-        # Access scores via the result object
-        if hasattr(result, "scores"):
-            for row in result.scores:
-                for metric_name, value in row.items():
-                    if metric_name not in ("user_input", "response", "retrieved_contexts", "reference"):
-                        normalized = normalize_metric_name(metric_name)
-                        # Handle potential list values
-                        if isinstance(value, (list, tuple)):
-                            scores[normalized] = value[0] if value else None
-                        else:
-                            scores[normalized] = value
-        elif hasattr(result, "to_pandas"):
-            # Alternative: convert to pandas and iterate
-            df = result.to_pandas()
-            if len(df) > 0:
-                row = df.iloc[0]
-                for col in df.columns:
-                    if col not in ("user_input", "response", "retrieved_contexts", "reference"):
-                        normalized = normalize_metric_name(col)
-                        scores[normalized] = row[col]
+        scores = {}
+        for row in rows:
+            for col, normalized in metric_cols.items():
+                value = row.get(col)
+                # Handle potential list values
+                if isinstance(value, (list, tuple)):
+                    scores[normalized] = value[0] if value else None
+                else:
+                    scores[normalized] = value
 
         return self._sanitize_scores(scores)
 
-    def _extract_scores_for_index(self, result, index: int) -> Dict[str, float]:
-        """Extract scores for a specific sample index from batch result.
+    def _score_table(self, result) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+        """Per-sample score rows of a result and its metric columns.
+
+        Reads result.scores (one dict per sample) directly rather than
+        building a DataFrame with to_pandas().
 
         Args:
             result: RAGAS EvaluationResult object
-            index: Index of sample in batch
 
         Returns:
-            Dict of normalized metric names to scores for that sample
+            Tuple of (one dict per sample, metric column -> normalized name)
         """
-        scores = {}
-
-        if hasattr(result, "to_pandas"):
-            df = result.to_pandas()
-            if len(df) > index:
-                row = df.iloc[index]
-                for col in df.columns:
-                    if col not in ("user_input", "response", "retrieved_contexts", "reference"):
-                        normalized = normalize_metric_name(col)
-                        scores[normalized] = row[col]
-
-        return self._sanitize_scores(scores)
+        rows = getattr(result, "scores", None) or []
+        metric_cols = {
+            col: normalize_metric_name(col)
+            for col in (rows[0] if rows else ())
+            if col not in _INPUT_COLUMNS
+        }
+        return rows, metric_cols
 
     @staticmethod
     def _sanitize_scores(scores: Dict[str, float]) -> Dict[str, float]:
@@ -1,15 +1,12 @@
 """LLM provider setup for RAGAS evaluation.
 
-RAGAS uses LangChain-style LLM wrappers for evaluation.
+RAGAS uses LangChain-style LLM wrappers for evaluation. The LangChain and
+RAGAS imports are deferred to the first call so importing the API does
+not load them at startup.
 """
 import logging
 from typing import Optional
 
-from langchain_anthropic import ChatAnthropic
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
-from ragas.llms import LangchainLLMWrapper
-from ragas.embeddings import LangchainEmbeddingsWrapper
-
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -25,7 +22,11 @@ def get_ragas_llm(provider: str = "anthropic", model: Optional[str] = None):
     Returns:
         LangchainLLMWrapper for RAGAS
     """
+    from ragas.llms import LangchainLLMWrapper
+
     if provider == "anthropic":
+        from langchain_anthropic import ChatAnthropic
+
         model = model or settings.claude_eval_model
         llm = ChatAnthropic(
             model=model,
@@ -35,6 +36,8 @@ def get_ragas_llm(provider: str = "anthropic", model: Optional[str] = None):
         )
         logger.info(f"Initialized RAGAS LLM with Anthropic ({model})")
     elif provider == "openai":
+        from langchain_openai import ChatOpenAI
+
         model = model or settings.openai_model
         llm = ChatOpenAI(
             model=model,
@@ -57,6 +60,9 @@ def get_ragas_embeddings():
     Returns:
         LangchainEmbeddingsWrapper for RAGAS
     """
+    from langchain_openai import OpenAIEmbeddings
+    from ragas.embeddings import LangchainEmbeddingsWrapper
+
     embeddings = OpenAIEmbeddings(
         model=settings.embedding_model,
         api_key=settings.openai_api_key,
@@ -2,13 +2,8 @@
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
-from ragas.metrics import (
-    LLMContextPrecisionWithoutReference,
-    LLMContextRecall,
-    Faithfulness,
-    AspectCritic,
-    FactualCorrectness,
-)
+# ragas.metrics is imported inside the metric factories; it pulls in
+# LangChain and is only needed once an evaluation actually runs.
 
 
 @dataclass
@@ -40,6 +35,10 @@ class RAGASMetricConfig:
     )
 
 
+# Shared default weights; compute_overall_score runs once per scored sample
+_DEFAULT_METRIC_CONFIG = RAGASMetricConfig()
+
+
 def get_answer_metrics(has_ground_truth: bool) -> List:
     """Get answer-level RAGAS metrics (LLM-as-judge on generated answers).
 
@@ -49,6 +48,8 @@ def get_answer_metrics(has_ground_truth: bool) -> List:
     Returns:
         List of RAGAS metric instances for answer evaluation
     """
+    from ragas.metrics import AspectCritic, FactualCorrectness
+
     metrics = [AspectCritic(name="answer_relevancy", definition="Does the response directly and completely answer the user's question?")]
     if has_ground_truth:
         metrics.append(FactualCorrectness())
@@ -64,6 +65,8 @@ def get_context_metrics(has_ground_truth: bool) -> List:
     Returns:
         List of RAGAS metric instances for retrieval evaluation
     """
+    from ragas.metrics import Faithfulness, LLMContextPrecisionWithoutReference, LLMContextRecall
+
     metrics = [LLMContextPrecisionWithoutReference(), Faithfulness()]
     if has_ground_truth:
         metrics.append(LLMContextRecall())
@@ -79,6 +82,14 @@ def get_metrics_for_evaluation(has_ground_truth: bool) -> List:
     Returns:
         List of RAGAS metric instances
     """
+    from ragas.metrics import (
+        AspectCritic,
+        FactualCorrectness,
+        Faithfulness,
+        LLMContextPrecisionWithoutReference,
+        LLMContextRecall,
+    )
+
     # Base metrics that don't require ground truth
     base_metrics = [
         LLMContextPrecisionWithoutReference(),
@@ -113,7 +124,7 @@ def compute_overall_score(
     Returns:
         Overall score in 0-1 range. Returns None if no valid scores.
     """
-    config = config or RAGASMetricConfig()
+    config = config or _DEFAULT_METRIC_CONFIG
     weights = (
         config.weights_with_ground_truth
         if has_ground_truth
@@ -124,8 +135,9 @@ def compute_overall_score(
     total_weight = 0.0
 
     for metric_name, weight in weights.items():
-        if metric_name in scores and scores[metric_name] is not None:
-            weighted_sum += scores[metric_name] * weight
+        score = scores.get(metric_name)
+        if score is not None:
+            weighted_sum += score * weight
             total_weight += weight
 
     if total_weight == 0:
@@ -159,4 +171,9 @@ def normalize_metric_name(name: str) -> str:
     Returns:
         Standardized metric name
     """
-    return METRIC_NAME_MAP.get(name.lower(), name.lower())
+    # RAGAS column names are already lowercase; only lower() on a miss
+    normalized = METRIC_NAME_MAP.get(name)
+    if normalized is None:
+        lowered = name.lower()
+        normalized = METRIC_NAME_MAP.get(lowered, lowered)
+    return normalized
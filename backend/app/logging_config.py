@@ -0,0 +1,30 @@
+"""Logging setup shared by the API and the ingestion scripts."""
+import logging
+import logging.config
+from typing import Optional
+
+from app.config import settings
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+def configure(level: Optional[str] = None) -> None:
+    """Configure root logging once for the process.
+
+    Args:
+        level: Log level name (defaults to settings.log_level)
+    """
+    logging.config.dictConfig({
+        "version": 1,
+        # Module loggers are created at import, before this runs
+        "disable_existing_loggers": False,
+        "formatters": {"default": {"format": LOG_FORMAT}},
+        "handlers": {
+            "console": {"class": "logging.StreamHandler", "formatter": "default"},
+        },
+        "root": {"level": level or settings.log_level, "handlers": ["console"]},
+    })
+
+    # RequestLoggingMiddleware already logs every request with its status
+    # and timing, so uvicorn's access log would only duplicate it
+    logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
@@ -1,42 +1,82 @@
 """FastAPI application entry point."""
+import asyncio
+import itertools
 import logging
+import os
 import time
-import uuid
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.config import settings
-from app.db.database import engine, Base
+from app.db.database import engine, Base, sync_indexes, sync_server_defaults
+from app.core.clients import close_clients
+from app.core.vectorstore.chromadb_store import ChromaDBStore
+from app.logging_config import configure as configure_logging
 
 # Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.log_level),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log all requests with timing information."""
+def _short_id() -> str:
+    """Return a random 8-hex-char id for error responses."""
+    return os.urandom(4).hex()
+
+
+# Request ids only correlate log lines, so a per-worker counter is enough;
+# the PID prefix keeps ids from different workers apart
+_request_counter = itertools.count()
+_worker_prefix = f"{os.getpid() & 0xffff:04x}"
+
+
+def _request_id() -> str:
+    """Return an 8-hex-char id for correlating a request's log lines."""
+    return f"{_worker_prefix}{next(_request_counter) & 0xffff:04x}"
+
+
+# Liveness probes hit these constantly; logging them only adds noise
+UNLOGGED_PATHS = frozenset({"/health", "/"})
+
+
+class RequestLoggingMiddleware:
+    """ASGI middleware to log all requests with timing information.
+
+    Written against raw ASGI rather than BaseHTTPMiddleware, which wraps
+    every request in extra streams and tasks just to pass it through.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"] in UNLOGGED_PATHS:
+            return await self.app(scope, receive, send)
+
+        request_id = _request_id()
+        start_time = time.perf_counter()
+        status_code = None
+        logger.info("[%s] %s %s", request_id, scope["method"], scope["path"])
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
-    async def dispatch(self, request: Request, call_next):
-        request_id = str(uuid.uuid4())[:8]
-        start_time = time.time()
-        logger.info(f"[{request_id}] {request.method} {request.url.path}")
         try:
-            response = await call_next(request)
-            duration_ms = (time.time() - start_time) * 1000
-            logger.info(f"[{request_id}] {response.status_code} in {duration_ms:.0f}ms")
-            return response
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            logger.error(f"[{request_id}] Failed after {duration_ms:.0f}ms: {e}", exc_info=True)
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            logger.error("[%s] Failed after %.0fms: %s", request_id, duration_ms, e, exc_info=True)
             raise
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        logger.info("[%s] %s in %.0fms", request_id, status_code, duration_ms)
 
 
 @asynccontextmanager
@@ -46,14 +86,27 @@ async def lifespan(app: FastAPI):
     logger.info("Starting RAGLens application...")
 
     # Create database tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    logger.info("Database tables created")
+    if settings.auto_create_tables:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await sync_server_defaults(conn)
+            await sync_indexes(conn)
+        logger.info("Database tables created")
+
+    # Open the shared ChromaDB client and load the index now rather than
+    # on the first chat request; a failure here only loses the warm-up
+    try:
+        vector_store = await asyncio.to_thread(ChromaDBStore)
+    except Exception as e:
+        logger.warning(f"Could not open ChromaDB for warm-up: {e}")
+    else:
+        await vector_store.warm_up()
 
     yield
 
     # Shutdown
     logger.info("Shutting down RAGLens application...")
+    await close_clients()
     await engine.dispose()
 
 
@@ -70,10 +123,13 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.get_cors_origins(),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PATCH", "DELETE"],
+    allow_headers=["Content-Type"],
 )
 
+# Compress large JSON payloads (batch results, evaluation lists, reports)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Add request logging middleware
 app.add_middleware(RequestLoggingMiddleware)
 
@@ -102,7 +158,7 @@ async def root():
 @app.exception_handler(Exception)
 async def global_exception_handler(_request: Request, exc: Exception):
     """Catch-all exception handler for unhandled errors."""
-    error_id = str(uuid.uuid4())[:8]
+    error_id = _short_id()
     logger.error(f"Unhandled exception [{error_id}]: {exc}", exc_info=True)
     return JSONResponse(
         status_code=500,
@@ -113,7 +169,7 @@ async def global_exception_handler(_request: Request, exc: Exception):
 @app.exception_handler(SQLAlchemyError)
 async def database_exception_handler(_request: Request, exc: SQLAlchemyError):
     """Handle database errors with detailed logging."""
-    error_id = str(uuid.uuid4())[:8]
+    error_id = _short_id()
     logger.error(f"Database error [{error_id}]: {exc}", exc_info=True)
     return JSONResponse(
         status_code=500,
@@ -1,10 +1,16 @@
 #!/usr/bin/env python3
 """Script to ingest Bitext dataset into ChromaDB."""
+import argparse
 import asyncio
 import os
 import sys
 from pathlib import Path
 
+try:
+    import uvloop  # Installed with uvicorn[standard]; unavailable on Windows
+except ImportError:
+    uvloop = None
+
 # Add correct path for both local and Docker environments
 script_dir = Path(__file__).parent.parent
 if (script_dir / "backend").exists():
@@ -18,25 +24,53 @@ from app.core.ingestion.loader import BitetDatasetLoader
 from app.core.ingestion.chunker import BitetChunker
 from app.core.vectorstore.chromadb_store import ChromaDBStore
 from app.config import settings
+from app.logging_config import configure as configure_logging
 import logging
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+configure_logging("INFO")
 logger = logging.getLogger(__name__)
 
 
-async def main():
+def parse_args() -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Ingest the Bitext dataset into ChromaDB")
+    parser.add_argument(
+        "--test-size", type=float, default=0.2,
+        help="Fraction of Q&A pairs held out for evaluation (default: 0.2)"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=42,
+        help="Random seed for the train/test split (default: 42)"
+    )
+    parser.add_argument(
+        "--force-resplit", action="store_true",
+        help="Re-split the dataset even if saved splits exist"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=50,
+        help="Chunks per embedding request (default: 50)"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=3,
+        help="Embedding requests in flight while writing to ChromaDB (default: 3)"
+    )
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace):
     """Main ingestion pipeline."""
     logger.info("=" * 60)
     logger.info("Starting Bitext dataset ingestion")
     logger.info("=" * 60)
 
-    # Step 1: Load dataset and create 80/20 train/test split
+    # Step 1: Load dataset and create train/test split (saved splits are reused)
     logger.info("\n[1/4] Loading Bitext dataset and creating train/test split...")
     loader = BitetDatasetLoader(raw_data_path=settings.raw_data_path)
-    train_items, test_items = loader.load_and_split(test_size=0.2, random_seed=42)
+    train_items, test_items = loader.load_and_split(
+        test_size=args.test_size,
+        random_seed=args.seed,
+        force_resplit=args.force_resplit
+    )
 
     # Only index training data; test set is held out for evaluation
     qa_items = train_items
@@ -44,7 +78,7 @@ async def main():
     # Get stats
     stats = loader.get_dataset_stats(qa_items)
     logger.info(f"Training set: {stats['total']} Q&A pairs")
-    logger.info(f"Test holdout: {len(test_items)} Q&A pairs (saved to bitext_test_holdout.json)")
+    logger.info(f"Test holdout: {len(test_items)} Q&A pairs (saved to bitext_test_holdout.json.gz)")
     logger.info(f"Categories: {stats['categories']['count']}, Intents: {stats['intents']['count']}")
     logger.info(f"Top categories: {stats['categories']['breakdown'][:5]}")
 
@@ -67,25 +101,32 @@ async def main():
     logger.info("\n[3/4] Initializing ChromaDB...")
     vector_store = ChromaDBStore()
 
-    # Check if collection already has data
-    existing_stats = vector_store.get_collection_stats()
-    if existing_stats["total_chunks"] > 0:
-        logger.warning(f"Collection already contains {existing_stats['total_chunks']} chunks. Resetting...")
+    # Chunk IDs are content hashes: drop chunks that are no longer in the
+    # training set (e.g. after a re-split), keep the rest without re-embedding
+    # Track the collection size from here on instead of re-counting it
+    total_chunks = vector_store.get_collection_stats()["total_chunks"]
+    if (vector_store.collection.metadata or {}).get("hnsw:space") != "cosine":
+        logger.warning("Collection was not created with cosine distance. Resetting...")
         vector_store.reset_collection()
+        total_chunks = 0
+    elif total_chunks > 0:
+        logger.info(f"Collection already contains {total_chunks} chunks. Syncing...")
+        total_chunks -= vector_store.delete_stale({ChromaDBStore.chunk_id(chunk["text"]) for chunk in chunks})
 
     # Step 4: Add to vector store
     logger.info("\n[4/4] Adding chunks to ChromaDB (this may take a while)...")
-    added_count = await vector_store.add_documents(chunks, batch_size=50)
+    added_count = await vector_store.add_documents(
+        chunks, batch_size=args.batch_size, max_in_flight=args.concurrency
+    )
 
     # Final stats
     logger.info("\n" + "=" * 60)
     logger.info("Ingestion complete!")
     logger.info("=" * 60)
     logger.info(f"Added {added_count} chunks")
-    final_stats = vector_store.get_collection_stats()
-    logger.info(f"Total chunks in collection: {final_stats['total_chunks']}")
-    logger.info(f"Collection: {final_stats['collection_name']}")
-    logger.info(f"Location: {final_stats['persist_directory']}")
+    logger.info(f"Total chunks in collection: {total_chunks + added_count}")
+    logger.info(f"Collection: {vector_store.collection_name}")
+    logger.info(f"Location: {vector_store.persist_directory}")
 
     # Test query
     logger.info("\n" + "=" * 60)
@@ -109,4 +150,8 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    args = parse_args()
+    if uvloop is not None:
+        uvloop.run(main(args))
+    else:
+        asyncio.run(main(args))